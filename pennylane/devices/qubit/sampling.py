@@ -13,8 +13,12 @@
 # limitations under the License.
 """Functions to sample a state."""
 
+from functools import lru_cache, wraps
+from itertools import chain
+from weakref import WeakSet, ref
 
 import numpy as np
+from cachetools import LRUCache
 
 import pennylane as qml
 from pennylane.measurements import (
@@ -24,12 +28,14 @@ from pennylane.measurements import (
     SampleMeasurement,
     ShadowExpvalMP,
     Shots,
+    VarianceMP,
 )
 from pennylane.ops import LinearCombination, Prod, SProd, Sum
+from pennylane.pauli.grouping.group_observables import _compute_partition_indices_from_binary
+from pennylane.pauli.utils import _binary_matrix_from_pws
 from pennylane.typing import TensorLike
 
 from .apply_operation import apply_operation
-from .measure import flatten_state
 
 
 def jax_random_split(prng_key, num: int = 2):
@@ -42,6 +48,12 @@ def jax_random_split(prng_key, num: int = 2):
     return split(prng_key, num=num)
 
 
+# observables returned by ``qml.simplify`` in ``_group_measurements``, so that grouping the same
+# measurements again does not simplify them a second time. Operators compare with ``qml.equal``,
+# so copies of a simplified observable are found as well.
+_simplified_observables = WeakSet()
+
+
 def _group_measurements(mps: list[SampleMeasurement | ClassicalShadowMP | ShadowExpvalMP]):
     """
     Group the measurements such that:
@@ -53,50 +65,110 @@ def _group_measurements(mps: list[SampleMeasurement | ClassicalShadowMP | Shadow
     if len(mps) == 1:
         return [mps], [[0]]
 
-    # measurements with pauli-word observables
-    mp_pauli_obs = []
+    for i, mp in enumerate(mps):
+        if isinstance(mp.obs, (Sum, SProd, Prod)) and mp.obs not in _simplified_observables:
+            mps[i].obs = qml.simplify(mp.obs)
+            _simplified_observables.add(mps[i].obs)
+
+    # the cached groups are immutable, each call gets its own lists
+    all_indices = [list(g) for g in _group_measurement_indices(tuple(map(_grouping_key, mps)))]
+    all_mp_groups = [[mps[i] for i in indices] for indices in all_indices]
+
+    return all_mp_groups, all_indices
+
+
+# grouping key of measurements that are measured on their own
+_UNGROUPED = "ungrouped"
+
 
-    # measurements with non pauli-word observables
-    mp_other_obs = []
+def _grouping_key(mp):
+    """Hashable description of a measurement holding everything its grouping depends on:
+    ``None`` without an observable, the pauli word of a pauli-word observable, and
+    ``_UNGROUPED`` otherwise. Unlike the measurement itself, it does not keep the data of
+    the observable alive in the grouping cache."""
+    if isinstance(mp, (ClassicalShadowMP, ShadowExpvalMP)):
+        return _UNGROUPED
+    if mp.obs is None:
+        return None
+    # same check as ``qml.pauli.is_pauli_word``, but the pauli word is kept so that the
+    # symplectic representation is built without walking the operator again
+    if len(pauli_rep := mp.obs.pauli_rep or ()) == 1:
+        return next(iter(pauli_rep))
+    return _UNGROUPED
+
+
+@lru_cache(maxsize=128)
+def _group_measurement_indices(keys: tuple) -> tuple[tuple[int, ...], ...]:
+    """
+    Compute the indices of the groups of measurements described in ``_group_measurements``,
+    from the grouping keys of the measurements given by ``_grouping_key``.
+
+    The result is cached, since the same measurements are grouped both when counting the
+    executions of a tape and when sampling it. It is returned as tuples, so that the cached
+    groups cannot be modified by the callers.
+    """
+    # in the common case where all the observables are pauli words, they are partitioned
+    # directly, without splitting the measurements by kind first
+    if all(key is not None and key is not _UNGROUPED for key in keys):
+        return tuple(map(tuple, _partition_pauli_words(list(keys))))
+
+    # indices of measurements with pauli-word observables and their pauli words
+    pauli_indices = []
+    pauli_words = []
+
+    # indices of measurements with non pauli-word observables
     mp_other_obs_indices = []
 
-    # measurements with no observables
-    mp_no_obs = []
+    # indices of measurements with no observables
     mp_no_obs_indices = []
-    for i, mp in enumerate(mps):
-        if isinstance(mp.obs, (Sum, SProd, Prod)):
-            mps[i].obs = qml.simplify(mp.obs)
-        if isinstance(mp, (ClassicalShadowMP, ShadowExpvalMP)):
-            mp_other_obs.append([mp])
-            mp_other_obs_indices.append([i])
-        elif mp.obs is None:
-            mp_no_obs.append(mp)
+    for i, key in enumerate(keys):
+        if key is _UNGROUPED:
+            mp_other_obs_indices.append((i,))
+        elif key is None:
             mp_no_obs_indices.append(i)
-        elif qml.pauli.is_pauli_word(mp.obs):
-            mp_pauli_obs.append((i, mp))
         else:
-            mp_other_obs.append([mp])
-            mp_other_obs_indices.append([i])
-    if mp_pauli_obs:
-        i_to_pauli_mp = dict(mp_pauli_obs)
-        part_indices = qml.pauli.compute_partition_indices(
-            [mp.obs for mp in i_to_pauli_mp.values()]
-        )
-        coeffs = list(i_to_pauli_mp.keys())
-        group_indices = [[coeffs[idx] for idx in group] for group in part_indices]
-        mp_pauli_groups = []
-        for indices in group_indices:
-            mp_group = [i_to_pauli_mp[i] for i in indices]
-            mp_pauli_groups.append(mp_group)
+            pauli_indices.append(i)
+            pauli_words.append(key)
+    if pauli_indices:
+        part_indices = _partition_pauli_words(pauli_words)
+        group_indices = [tuple(pauli_indices[idx] for idx in group) for group in part_indices]
     else:
-        mp_pauli_groups, group_indices = [], []
+        group_indices = []
 
-    mp_no_obs_indices = [mp_no_obs_indices] if mp_no_obs else []
-    mp_no_obs = [mp_no_obs] if mp_no_obs else []
-    all_mp_groups = mp_pauli_groups + mp_no_obs + mp_other_obs
-    all_indices = group_indices + mp_no_obs_indices + mp_other_obs_indices
+    mp_no_obs_indices = [tuple(mp_no_obs_indices)] if mp_no_obs_indices else []
 
-    return all_mp_groups, all_indices
+    return tuple(group_indices + mp_no_obs_indices + mp_other_obs_indices)
+
+
+def _partition_pauli_words(pauli_words):
+    """Partition pauli words into qubit-wise commuting groups."""
+    wire_map = {w: c for c, w in enumerate(dict.fromkeys(chain.from_iterable(pauli_words)))}
+    binary_matrix = _binary_matrix_from_pws(pauli_words, len(wire_map), wire_map=wire_map)
+    return _compute_partition_indices_from_binary(pauli_words, binary_matrix)
+
+
+def _cache_on_hash(fn):
+    """Cache the results of ``fn(obs)`` in a least recently used cache keyed on ``obs.hash``.
+
+    The cache only holds weak references to the observables, so that it does not keep them alive,
+    and a hit on another observable is confirmed with ``qml.equal``, so that a hash collision
+    never returns the result of a different observable.
+    """
+    cache = LRUCache(maxsize=128)
+
+    @wraps(fn)
+    def wrapper(obs):
+        key = obs.hash
+        if (entry := cache.get(key)) is not None:
+            cached_obs = entry[0]()
+            if cached_obs is obs or (cached_obs is not None and qml.equal(cached_obs, obs)):
+                return entry[1]
+        res = fn(obs)
+        cache[key] = (ref(obs), res)
+        return res
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
 def _get_num_executions_for_expval_H(obs):
@@ -106,27 +178,34 @@ def _get_num_executions_for_expval_H(obs):
     return _get_num_wire_groups_for_expval_H(obs)
 
 
+@_cache_on_hash
 def _get_num_wire_groups_for_expval_H(obs):
+    """Number of groups of terms of ``obs`` acting on disjoint wires.
+
+    The result only depends on the observable, so it is cached for equal observables.
+    """
     _, obs_list = obs.terms()
-    wires_list = []
-    added_obs = []
-    num_groups = 0
+    # the wires of each term and of each group are stored as integer bitmasks,
+    # so that checking whether a term overlaps with a group is a single AND
+    wire_to_bit = {w: 1 << i for i, w in enumerate(obs.wires)}
+    group_masks = []
+    # terms are deduplicated by hash, which avoids comparing each new term
+    # against all the previous ones with ``qml.equal``
+    added_hashes = set()
     for o in obs_list:
-        if o in added_obs:
+        if o.hash in added_hashes:
             continue
         if isinstance(o, qml.Identity):
             continue
-        added = False
-        for wires in wires_list:
-            if len(qml.wires.Wires.shared_wires([wires, o.wires])) == 0:
-                added_obs.append(o)
-                added = True
+        added_hashes.add(o.hash)
+        o_mask = sum(wire_to_bit[w] for w in o.wires)
+        for k, group_mask in enumerate(group_masks):
+            if group_mask & o_mask == 0:
+                group_masks[k] |= o_mask
                 break
-        if not added:
-            added_obs.append(o)
-            wires_list.append(o.wires)
-            num_groups += 1
-    return num_groups
+        else:
+            group_masks.append(o_mask)
+    return len(group_masks)
 
 
 def _get_num_executions_for_sum(obs):
@@ -134,6 +213,15 @@ def _get_num_executions_for_sum(obs):
     if obs.grouping_indices:
         return len(obs.grouping_indices)
 
+    return _get_num_qwc_groups_for_sum(obs)
+
+
+@_cache_on_hash
+def _get_num_qwc_groups_for_sum(obs):
+    """Number of executions needed to measure the terms of ``obs`` without grouping indices.
+
+    The result only depends on the observable, so it is cached for equal observables.
+    """
     if not obs.pauli_rep:
         return sum(int(not isinstance(o, qml.Identity)) for o in obs.terms()[1])
 
@@ -191,6 +279,9 @@ def _apply_diagonalizing_gates(
 ):
     if len(mps) == 1:
         diagonalizing_gates = mps[0].diagonalizing_gates()
+    elif all(mp.obs is None or not mp.obs.diagonalizing_gates() for mp in mps):
+        # the state is already in the measurement basis
+        return state
     elif all(mp.obs for mp in mps):
         diagonalizing_gates = qml.pauli.diagonalize_qwc_pauli_words([mp.obs for mp in mps])[0]
     else:
@@ -256,12 +347,12 @@ def measure_with_samples(
             )
         )
 
-    flat_indices = [_i for i in indices for _i in i]
-
-    # reorder results
-    sorted_res = tuple(
-        res for _, res in sorted(list(enumerate(all_res)), key=lambda r: flat_indices[r[0]])
-    )
+    # reorder results: the group indices form a permutation of the measurement
+    # indices, so each result can be placed directly without sorting
+    sorted_res = [None] * len(all_res)
+    for i, res in zip(chain.from_iterable(indices), all_res):
+        sorted_res[i] = res
+    sorted_res = tuple(sorted_res)
 
     # append MCM samples
     if mid_measurements:
@@ -307,16 +398,17 @@ def _measure_with_samples_diagonalizing_gates(
     total_indices = len(state.shape) - is_state_batched
     wires = qml.wires.Wires(range(total_indices))
 
-    def _process_single_shot(samples):
-        processed = []
-        for mp in mps:
+    def _process_single_bin(i, mp, samples, bin_idx=0):
+        if i in binned_results:
+            res = binned_results[i][bin_idx]
+        elif i in pauli_expvals:
+            res = _pauli_word_expval(samples, *pauli_expvals[i])
+        else:
             res = mp.process_samples(samples, wires)
-            if not isinstance(mp, CountsMP):
-                res = qml.math.squeeze(res)
-
-            processed.append(res)
+        if not isinstance(mp, CountsMP):
+            res = qml.math.squeeze(res)
 
-        return tuple(processed)
+        return res
 
     try:
         prng_key, _ = jax_random_split(prng_key)
@@ -333,15 +425,61 @@ def _measure_with_samples_diagonalizing_gates(
             raise e
         samples = qml.math.full((shots.total_shots, len(wires)), 0)
 
-    processed_samples = []
-    for lower, upper in shots.bins():
-        shot = _process_single_shot(samples[..., lower:upper, :])
-        processed_samples.append(shot)
+    # Expectation values of pauli words with real coefficients are read off the parity of the
+    # samples on their wires, which all the terms of a group share after diagonalization.
+    pauli_expvals = {}
+    for i, mp in enumerate(mps):
+        if (
+            isinstance(mp, ExpectationMP)
+            and len(pauli_rep := getattr(mp.obs, "pauli_rep", None) or ()) == 1
+        ):
+            ((pauli_word, coeff),) = pauli_rep.items()
+            if not np.iscomplexobj(coeff):
+                pauli_expvals[i] = (coeff, wires.indices(list(pauli_word)))
+
+    # When the shots are split into bins of equal size, expectation values and variances are
+    # computed for all bins at once, by treating the bins as a batch dimension of the samples.
+    binned_results = {}
+    bins = list(shots.bins())
+    bin_size = bins[0][1] - bins[0][0]
+    if (
+        shots.has_partitioned_shots
+        and not is_state_batched
+        and all(upper - lower == bin_size for lower, upper in bins)
+    ):
+        binned_samples = qml.math.reshape(samples, (len(bins), bin_size, len(wires)))
+        for i, mp in enumerate(mps):
+            if isinstance(mp, (ExpectationMP, VarianceMP)) and mp.wires:
+                binned_results[i] = mp.process_samples(binned_samples, wires)
+
+    # the samples of each bin are sliced once, up front; a single bin spans all the samples,
+    # which are then used as they are, since slicing copies them for some interfaces
+    if len(bins) == 1:
+        bin_samples = [samples]
+    else:
+        bin_samples = [samples[..., lower:upper, :] for lower, upper in bins]
+
+    # the results are collected per measurement, with one entry per bin, which is the
+    # layout returned for partitioned shots
+    processed_samples = tuple(
+        tuple(
+            _process_single_bin(i, mp, samples_in_bin, bin_idx)
+            for bin_idx, samples_in_bin in enumerate(bin_samples)
+        )
+        for i, mp in enumerate(mps)
+    )
 
     if shots.has_partitioned_shots:
-        return tuple(zip(*processed_samples))
+        return processed_samples
+
+    return tuple(res[0] for res in processed_samples)
 
-    return processed_samples[0]
+
+def _pauli_word_expval(samples, coeff, wire_indices):
+    """Expectation value of a pauli word with coefficient ``coeff``, acting non-trivially on
+    the columns ``wire_indices`` of samples taken in its eigenbasis."""
+    parities = qml.math.sum(samples[..., wire_indices], axis=-1) % 2
+    return coeff * qml.math.mean(1 - 2 * parities, axis=-1)
 
 
 def _measure_classical_shadow(
@@ -395,23 +533,24 @@ def _measure_hamiltonian_with_samples(
     mp = mp[0]
 
     # if the measurement process involves a Hamiltonian, measure each
-    # of the terms separately and sum
-    def _sum_for_single_shot(s, prng_key=None):
-        results = measure_with_samples(
-            [ExpectationMP(t) for t in mp.obs.terms()[1]],
-            state,
-            s,
-            is_state_batched=is_state_batched,
-            rng=rng,
-            prng_key=prng_key,
-        )
-        return sum(c * res for c, res in zip(mp.obs.terms()[0], results))
-
-    keys = jax_random_split(prng_key, num=shots.num_copies)
-    unsqueezed_results = tuple(
-        _sum_for_single_shot(type(shots)(s), key) for s, key in zip(shots, keys)
+    # of the terms separately and sum. The terms are measured for all shot
+    # copies at once, so that each group of qubit-wise commuting terms is
+    # diagonalized and sampled a single time.
+    coeffs, ops = mp.obs.terms()
+    results = measure_with_samples(
+        [ExpectationMP(t) for t in ops],
+        state,
+        shots,
+        is_state_batched=is_state_batched,
+        rng=rng,
+        prng_key=prng_key,
     )
-    return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
+
+    if shots.has_partitioned_shots:
+        # the results of each shot copy come first, unless there are no terms to measure
+        results = results or ((),) * shots.num_copies
+        return [tuple(sum(c * res for c, res in zip(coeffs, r)) for r in results)]
+    return [sum(c * res for c, res in zip(coeffs, results))]
 
 
 def _measure_sum_with_samples(
@@ -426,23 +565,19 @@ def _measure_sum_with_samples(
     mp = mp[0]
 
     # if the measurement process involves a Sum, measure each
-    # of the terms separately and sum
-    def _sum_for_single_shot(s, prng_key=None):
-        results = measure_with_samples(
-            [ExpectationMP(t) for t in mp.obs],
-            state,
-            s,
-            is_state_batched=is_state_batched,
-            rng=rng,
-            prng_key=prng_key,
-        )
-        return sum(results)
-
-    keys = jax_random_split(prng_key, num=shots.num_copies)
-    unsqueezed_results = tuple(
-        _sum_for_single_shot(type(shots)(s), key) for s, key in zip(shots, keys)
+    # of the terms separately and sum, for all shot copies at once
+    results = measure_with_samples(
+        [ExpectationMP(t) for t in mp.obs],
+        state,
+        shots,
+        is_state_batched=is_state_batched,
+        rng=rng,
+        prng_key=prng_key,
     )
-    return [unsqueezed_results] if shots.has_partitioned_shots else [unsqueezed_results[0]]
+
+    if shots.has_partitioned_shots:
+        return [tuple(sum(r) for r in results)]
+    return [sum(results)]
 
 
 def sample_state(
@@ -477,15 +612,30 @@ def sample_state(
     wires_to_sample = wires or state_wires
     num_wires = len(wires_to_sample)
 
-    flat_state = flatten_state(state, total_indices)
-    with qml.queuing.QueuingManager.stop_recording():
-        probs = qml.probs(wires=wires_to_sample).process_state(flat_state, state_wires)
-        # Keep same interface (e.g. jax) as in the device
+    # Compute the probabilities directly on the state tensor, where each axis corresponds
+    # to a wire, rather than going through ``qml.probs(...).process_state``. Using
+    # ``qml.math`` keeps the same interface (e.g. jax) as in the device, and unlike
+    # ``qml.math.imag``, the conjugate is also defined for real torch tensors.
+    probs = qml.math.real(state * qml.math.conj(state))
+    if wires_to_sample != state_wires:
+        inactive_axes = tuple(
+            i + is_state_batched for i in range(total_indices) if i not in wires_to_sample
+        )
+        if inactive_axes:
+            probs = qml.math.sum(probs, axis=inactive_axes)
+        # the remaining axes are ordered by wire, rearrange them into the sampled order
+        desired_axes = np.argsort(np.argsort(list(wires_to_sample)))
+        if is_state_batched:
+            desired_axes = np.insert(desired_axes + 1, 0, 0)
+        probs = qml.math.transpose(probs, desired_axes)
+
+    flat_shape = (state.shape[0], -1) if is_state_batched else (-1,)
+    probs = qml.math.reshape(probs, flat_shape)
 
     return sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key)
 
 
-def sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key=None):
+def sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key=None, sample_dtype=None):
     """
     Sample from given probabilities, dispatching between JAX and NumPy implementations.
 
@@ -499,14 +649,18 @@ def sample_probs(probs, shots, num_wires, is_state_batched, rng, prng_key=None):
             If no value is provided, a default RNG will be used
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is
             the key to the JAX pseudo random number generator. Only for simulation using JAX.
+        sample_dtype (Optional[np.dtype]): The floating point type used to sample with NumPy.
+            See ``_sample_probs_numpy``. Not used for simulation using JAX.
     """
     if qml.math.get_interface(probs) == "jax" or prng_key is not None:
         return _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key, seed=rng)
 
-    return _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng)
+    return _sample_probs_numpy(
+        probs, shots, num_wires, is_state_batched, rng, sample_dtype=sample_dtype
+    )
 
 
-def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng):
+def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng, sample_dtype=None):
     """
     Sample from given probabilities using NumPy's random number generator.
 
@@ -518,27 +672,77 @@ def _sample_probs_numpy(probs, shots, num_wires, is_state_batched, rng):
         rng (Union[None, int, array_like[int], SeedSequence, BitGenerator, Generator]):
             A seed-like parameter matching that of ``seed`` for ``numpy.random.default_rng``.
             If no value is provided, a default RNG will be used
+        sample_dtype (Optional[np.dtype]): The floating point type of the cumulative distribution
+            and of the uniform random numbers used to sample. Defaults to ``np.float64``.
+            ``np.float32`` halves the memory used to sample many wires, but only resolves
+            probabilities down to about ``1e-7``. The returned samples are always integers.
     """
     rng = np.random.default_rng(rng)
-    norm = qml.math.sum(probs, axis=-1)
-    norm_err = qml.math.abs(norm - 1.0)
+    probs = qml.math.to_numpy(probs)
+    sample_dtype = np.dtype(sample_dtype or np.float64)
+
+    cdf = np.cumsum(probs, axis=-1, dtype=sample_dtype)
+    if sample_dtype == np.float64:
+        # The norm of the probabilities is read off the end of the CDF, so that the
+        # probabilities are only traversed once.
+        norm = cdf[..., -1:]
+    else:
+        # the end of a lower precision CDF is not accurate enough to validate the norm
+        norm = np.sum(probs, axis=-1, keepdims=True, dtype=np.float64)
     cutoff = 1e-07
 
-    norm_err = norm_err[..., np.newaxis] if not is_state_batched else norm_err
-    if qml.math.any(norm_err > cutoff):
+    if np.any(np.abs(norm - 1.0) > cutoff):
         raise ValueError("probabilities do not sum to 1")
-
-    basis_states = np.arange(2**num_wires)
+    if np.any(np.isnan(norm)):
+        raise ValueError("probabilities contain NaN")
+
+    if num_wires >= 4 and 2**num_wires < shots:
+        # With fewer basis states than shots, it is cheaper to draw the number of occurrences
+        # of each basis state from a multinomial distribution, and to shuffle the repeated
+        # basis states into a sequence of independent samples. The binary search of the
+        # inverse CDF is only costly enough for this to pay off from 16 basis states on, and
+        # fewer wires keep the inverse-CDF sample stream for a given seed.
+        counts = rng.multinomial(shots, probs / norm)
+        basis_states = np.broadcast_to(np.arange(2**num_wires), counts.shape)
+        samples = np.repeat(basis_states.ravel(), counts.ravel())
+        samples = rng.permuted(samples.reshape(counts.shape[:-1] + (shots,)), axis=-1)
+        return _unpack_samples(samples, num_wires)
+
+    # Inverse-CDF sampling, equivalent to ``rng.choice(basis_states, shots, p=p)`` for
+    # each batch element, but building every CDF and drawing every uniform in one call.
+    cdf /= cdf[..., -1:]
+    uniforms = rng.random(cdf.shape[:-1] + (shots,), dtype=sample_dtype)
     if is_state_batched:
-        probs = probs / norm[:, np.newaxis] if norm.shape else probs / norm
-        samples = np.stack([rng.choice(basis_states, shots, p=p) for p in probs])
+        samples = np.stack([np.searchsorted(c, u, side="right") for c, u in zip(cdf, uniforms)])
     else:
-        probs = probs / norm
-        samples = rng.choice(basis_states, shots, p=probs)
+        samples = np.searchsorted(cdf, uniforms, side="right")
 
-    powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
-    states_sampled_base_ten = samples[..., None] & powers_of_two
-    return (states_sampled_base_ten > 0).astype(np.int64)
+    return _unpack_samples(samples, num_wires)
+
+
+def _unpack_samples(samples, num_wires):
+    """Convert integer basis-state samples into arrays of bits, most significant wire first.
+
+    Args:
+        samples (array[int]): The sampled basis state indices
+        num_wires (int): The number of wires that were sampled
+
+    Returns:
+        ndarray[int]: Sample values of the shape ``samples.shape + (num_wires,)``
+    """
+    if num_wires > 64:
+        powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
+        states_sampled_base_ten = samples[..., None] & powers_of_two
+        return (states_sampled_base_ten > 0).astype(np.int64)
+
+    # view each sample as its little-endian bytes, and only unpack the bytes that hold the
+    # sampled wires, most significant first, so that ``np.unpackbits`` yields the bits of
+    # the sample most significant first
+    num_bytes = (num_wires + 7) // 8
+    samples_bytes = np.asarray(samples, dtype="<i8").reshape(-1).view(np.uint8)
+    samples_bytes = samples_bytes.reshape(np.shape(samples) + (8,))[..., :num_bytes][..., ::-1]
+    bits = np.unpackbits(samples_bytes, axis=-1)
+    return bits[..., 8 * num_bytes - num_wires :].astype(np.int64)
 
 
 def _sample_probs_jax(probs, shots, num_wires, is_state_batched, prng_key=None, seed=None):
@@ -16,6 +16,7 @@ Submodule for sampling a qubit mixed state.
 """
 # pylint: disable=too-many-positional-arguments
 from collections.abc import Callable
+from itertools import chain
 
 import numpy as np
 
@@ -86,16 +87,12 @@ def _measure_with_samples_diagonalizing_gates(
     total_indices = _get_num_wires(state, is_state_batched)
     wires = qml.wires.Wires(range(total_indices))
 
-    def _process_single_shot(samples):
-        processed = []
-        for mp in mps:
-            res = mp.process_samples(samples, wires)
-            if not isinstance(mp, CountsMP):
-                res = math.squeeze(res)
+    def _process_single_bin(mp, samples):
+        res = mp.process_samples(samples, wires)
+        if not isinstance(mp, CountsMP):
+            res = math.squeeze(res)
 
-            processed.append(res)
-
-        return tuple(processed)
+        return res
 
     prng_key, _ = jax_random_split(prng_key)
     samples = sample_state(
@@ -107,15 +104,18 @@ def _measure_with_samples_diagonalizing_gates(
         prng_key=prng_key,
         readout_errors=readout_errors,
     )
-    processed_samples = []
-    for lower, upper in shots.bins():
-        shot = _process_single_shot(samples[..., lower:upper, :])
-        processed_samples.append(shot)
+    # the results are collected per measurement, with one entry per bin, which is the
+    # layout returned for partitioned shots
+    bin_samples = [samples[..., lower:upper, :] for lower, upper in shots.bins()]
+    processed_samples = tuple(
+        tuple(_process_single_bin(mp, samples_in_bin) for samples_in_bin in bin_samples)
+        for mp in mps
+    )
 
     if shots.has_partitioned_shots:
-        return tuple(zip(*processed_samples))
+        return processed_samples
 
-    return processed_samples[0]
+    return tuple(res[0] for res in processed_samples)
 
 
 def _measure_classical_shadow(
@@ -343,12 +343,12 @@ def measure_with_samples(
             )
         )
 
-    flat_indices = [_i for i in indices for _i in i]
-
-    # reorder results
-    sorted_res = tuple(
-        res for _, res in sorted(list(enumerate(all_res)), key=lambda r: flat_indices[r[0]])
-    )
+    # reorder results: the group indices form a permutation of the measurement
+    # indices, so each result can be placed directly without sorting
+    sorted_res = [None] * len(all_res)
+    for i, res in zip(chain.from_iterable(indices), all_res):
+        sorted_res[i] = res
+    sorted_res = tuple(sorted_res)
 
     # put the shot vector axis before the measurement axis
     if shots.has_partitioned_shots:
@@ -61,7 +61,9 @@ from .gradient_transform import (
 
 NONINVOLUTORY_OBS = {
     "Hermitian": lambda obs: obs.__class__(obs.matrix() @ obs.matrix(), wires=obs.wires),
-    "SparseHamiltonian": lambda obs: obs.__class__(obs.matrix() @ obs.matrix(), wires=obs.wires),
+    "SparseHamiltonian": lambda obs: obs.__class__(
+        obs.sparse_matrix() @ obs.sparse_matrix(), wires=obs.wires
+    ),
     "Projector": lambda obs: obs,
 }
 """Dict[str, callable]: mapping from a non-involutory observable name
@@ -16,11 +16,13 @@ This submodule contains the discrete-variable quantum observables,
 excepting the Pauli gates and Hadamard gate in ``non_parametric_ops.py``.
 """
 
+import math
 import warnings
 from collections.abc import Sequence
 from copy import copy
 
 import numpy as np
+from cachetools import LRUCache
 from scipy.sparse import csr_matrix, spmatrix
 
 import pennylane as qml
@@ -29,6 +31,121 @@ from pennylane.typing import TensorLike
 from pennylane.wires import Wires, WiresLike
 
 from .matrix_ops import QubitUnitary
+from .non_parametric_ops import PauliX
+
+_EPS = np.finfo(np.float64).eps / 2
+
+# dtypes whose projector eigenvalues are returned in single precision, i.e. those whose name ends
+# in "32" as checked for the other interfaces
+_SINGLE_PRECISION_DTYPES = frozenset(map(np.dtype, (np.float32, np.int32, np.uint32)))
+
+# number of wires above which dense basis state projector matrices trigger a memory warning
+_MAX_DENSE_PROJECTOR_WIRES = 12
+
+# number of wires above which dense SparseHamiltonian matrices trigger a memory warning
+_MAX_DENSE_SPARSE_HAMILTONIAN_WIRES = 10
+
+
+def _eigh_2x2(A, eigvals_only=False):
+    r"""Closed-form eigendecomposition of a :math:`2\times 2` hermitian matrix.
+
+    This avoids the dispatch overhead of ``np.linalg.eigh`` for single-qubit observables. As in
+    LAPACK, the off-diagonal element is made real by a phase on the second row of the
+    eigenvectors, and the real symmetric matrix is diagonalized by the rotation of ``DLAEV2``,
+    so that the eigenvectors agree with ``np.linalg.eigh`` up to a sign. The computation is done
+    on half sums and ratios of the entries, which neither overflow nor underflow for very large
+    or very small entries. The eigenvalues are returned in ascending order, and both results
+    keep the precision of the matrix.
+
+    Args:
+        A (array): hermitian matrix of shape ``(2, 2)``
+        eigvals_only (bool): whether to only compute the eigenvalues
+
+    Returns:
+        array or tuple[array, array]: the eigenvalues, and the eigenvectors as columns unless
+        ``eigvals_only`` is ``True``
+    """
+    (a, _), (b, d) = A.tolist()
+    a, d, b = a.real, d.real, complex(b)
+    if b.imag:
+        e = -math.copysign(abs(b), b.real)
+        phase = b / e
+    else:
+        e = b.real
+        phase = 1
+
+    if abs(e) <= math.sqrt(abs(a)) * math.sqrt(abs(d)) * _EPS:
+        # negligible off-diagonal element
+        rt1, rt2, c, s = a, d, 1.0, 0.0
+    else:
+        # halves of the trace, of the diagonal difference and of the eigenvalue gap; rt1 is the
+        # eigenvalue of largest absolute value, and rt2 is computed from the determinant
+        m, h = 0.5 * a + 0.5 * d, 0.5 * a - 0.5 * d
+        r = math.hypot(h, e)
+        acmx, acmn = (a, d) if abs(a) > abs(d) else (d, a)
+        if m == 0:
+            rt1, rt2 = r, -r
+        else:
+            rt1 = m - r if m < 0 else m + r
+            rt2 = (acmx / rt1) * acmn - (e / rt1) * e
+
+        if not eigvals_only:
+            # (c, s) is the eigenvector of rt1
+            ch = h + r if h >= 0 else h - r
+            if abs(ch) > abs(e):
+                ct = -e / ch
+                s = 1 / math.sqrt(1 + ct * ct)
+                c = ct * s
+            else:
+                tn = -ch / e
+                c = 1 / math.sqrt(1 + tn * tn)
+                s = tn * c
+            if (m < 0) == (h < 0):
+                c, s = -s, c
+
+    dtype = np.result_type(A.dtype, np.float32)
+    w = np.array([rt2, rt1] if rt2 < rt1 else [rt1, rt2], dtype=np.finfo(dtype).dtype)
+    if eigvals_only:
+        return w
+
+    if rt2 < rt1:
+        U = [[-s, c], [phase * c, phase * s]]
+    else:
+        U = [[c, -s], [phase * s, phase * c]]
+    return w, np.array(U, dtype=dtype)
+
+
+def _basis_state_index(basis_state) -> int:
+    """Index of a computational basis state, given as a sequence of bits with the most
+    significant bit first."""
+    bits = np.asarray(basis_state)
+    if np.any((bits != 0) & (bits != 1)):
+        raise ValueError(f"Basis state must only consist of 0s and 1s; got {basis_state}")
+    bits = bits[::-1].astype(np.uint8)
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+
+def _householder_unitary(state_vector: np.ndarray) -> np.ndarray:
+    """Hermitian Householder reflection mapping a NumPy state vector, up to a global phase, onto
+    the first computational basis state."""
+    # the scalar work is done on Python scalars, which are much cheaper than NumPy scalars and
+    # keep the precision of the state, while the complex phase makes psi complex
+    p0 = complex(state_vector[0])
+    r0 = abs(p0)
+    # remove the phase of the first amplitude, leaving it equal to its magnitude
+    phase = p0.conjugate() / r0 if r0 else complex(1)
+    # the normalized Householder vector is (psi + e_0) / sqrt(2 + 2 |psi_0|); folding in sqrt(2)
+    # gives 2|v><v| as a plain outer product, and the phase, shift and normalization are all
+    # applied in a single scaled copy of the state
+    scale = 1 / math.sqrt(1 + r0)
+    psi = state_vector * (phase * scale)
+    psi[0] += scale
+    # rank-1 update in a single pass over the matrix; the identity is only subtracted along
+    # the diagonal (through a flat view, which is cheaper than the flat iterator). Filling
+    # only one triangle and mirroring it is slower, as the mirror is a second strided pass.
+    u = np.multiply.outer(psi, psi.conj())
+    u.ravel()[:: len(psi) + 1] -= 1
+    return u
 
 
 class Hermitian(Operator):
@@ -71,6 +188,13 @@ class Hermitian(Operator):
     # Qubit case
     _num_basis_states = 2
     _eigs = {}
+    # Each cached entry holds the matrix bytes (its key), the eigenvectors and the eigenvalues,
+    # i.e. about twice the size of the matrix: 32 KiB for a 5-qubit complex128 matrix, but 32 MiB
+    # for a 10-qubit one. The cache is thus bounded both in entries and in bytes, and matrices
+    # too large for the byte budget are not cached at all. Evicting entries is always safe, as a
+    # missing eigendecomposition is simply recomputed.
+    _eigs_max_size = 128
+    _eigs_max_bytes = 64 * 2**20
 
     def __init__(self, A: TensorLike, wires: WiresLike, id: str | None = None):
         A = np.array(A) if isinstance(A, list) else A
@@ -92,13 +216,18 @@ class Hermitian(Operator):
     @staticmethod
     def _validate_input(A: TensorLike, expected_mx_shape: int | None = None):
         """Validate the input matrix."""
-        if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+        shape = A.shape
+        # a single comparison accepts the common, valid case
+        if expected_mx_shape is not None and shape == (expected_mx_shape, expected_mx_shape):
+            return
+
+        if len(shape) != 2 or shape[0] != shape[1]:
             raise ValueError("Observable must be a square matrix.")
 
-        if expected_mx_shape is not None and A.shape[0] != expected_mx_shape:
+        if expected_mx_shape is not None:
             raise ValueError(
                 f"Expected input matrix to have shape {expected_mx_shape}x{expected_mx_shape}, but "
-                f"a matrix with shape {A.shape[0]}x{A.shape[0]} was passed."
+                f"a matrix with shape {shape[0]}x{shape[0]} was passed."
             )
 
     def label(
@@ -140,6 +269,16 @@ class Hermitian(Operator):
     def compute_sparse_matrix(A, format="csr") -> csr_matrix:
         return csr_matrix(Hermitian.compute_matrix(A)).asformat(format)
 
+    def matrix(self, wire_order: WiresLike | None = None) -> TensorLike:
+        A = self.data[0]
+        if qml.math.is_abstract(A):
+            return super().matrix(wire_order=wire_order)
+
+        # concrete matrices are validated on construction, so the data is the canonical matrix
+        if wire_order is None or self.wires == Wires(wire_order):
+            return A
+        return qml.math.expand_matrix(A, wires=self.wires, wire_order=wire_order)
+
     @property
     def eigendecomposition(self) -> dict[str, TensorLike]:
         """Return the eigendecomposition of the matrix specified by the Hermitian observable.
@@ -152,24 +291,61 @@ class Hermitian(Operator):
         Returns:
             dict[str, array]: dictionary containing the eigenvalues and the eigenvectors of the Hermitian observable
         """
-        Hmat = self.matrix()
-        Hmat = qml.math.to_numpy(Hmat)
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in Hermitian._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            Hermitian._eigs[Hkey] = {"eigvec": U, "eigval": w}
+        # the canonical matrix is the (already validated) operator data itself
+        Hmat = self.data[0]
+        if type(Hmat) is not np.ndarray:  # pylint: disable=unidiomatic-typecheck
+            Hmat = qml.math.to_numpy(Hmat)
+        Hkey = (Hmat.shape, Hmat.dtype.str, Hmat.tobytes())
+        eigs = Hermitian._cached_eigs(Hkey)
+        if eigs is None:
+            w, U = _eigh_2x2(Hmat) if Hmat.shape == (2, 2) else np.linalg.eigh(Hmat)
+            eigs = {"eigvec": U, "eigval": w}
+            Hermitian._cache_eigs(Hkey, eigs)
+
+        return eigs
+
+    @staticmethod
+    def _cached_eigs(key) -> dict[str, TensorLike] | None:
+        """Look up a cached eigendecomposition, marking it as the most recently used."""
+        eigs = Hermitian._eigs.pop(key, None)
+        if eigs is not None:
+            Hermitian._eigs[key] = eigs
+        return eigs
 
-        return Hermitian._eigs[Hkey]
+    @staticmethod
+    def _cache_eigs(key, eigs: dict[str, TensorLike]):
+        """Cache an eigendecomposition, evicting the least recently used entries beyond
+        ``Hermitian._eigs_max_size`` entries or ``Hermitian._eigs_max_bytes`` bytes."""
+        if Hermitian._eigs_nbytes(key, eigs) > Hermitian._eigs_max_bytes:
+            return
+        Hermitian._eigs[key] = eigs
+        while len(Hermitian._eigs) > Hermitian._eigs_max_size or (
+            sum(map(Hermitian._eigs_nbytes, Hermitian._eigs, Hermitian._eigs.values()))
+            > Hermitian._eigs_max_bytes
+        ):
+            del Hermitian._eigs[next(iter(Hermitian._eigs))]
+
+    @staticmethod
+    def _eigs_nbytes(key, eigs: dict[str, TensorLike]) -> int:
+        """Number of bytes held by a cached eigendecomposition and its key."""
+        return len(key[2]) + eigs["eigvec"].nbytes + eigs["eigval"].nbytes
 
     def eigvals(self) -> TensorLike:
         """Return the eigenvalues of the specified Hermitian observable.
 
         This method uses pre-stored eigenvalues for standard observables where
         possible and stores the corresponding eigenvectors from the eigendecomposition.
+        The eigenvalues of single-qubit observables are computed in closed form instead,
+        with the same routine as :attr:`eigendecomposition`, but without computing or storing
+        eigenvectors.
 
         Returns:
             array: array containing the eigenvalues of the Hermitian observable
         """
+        A = self.data[0]
+        if isinstance(A, np.ndarray) and A.shape == (2, 2):
+            return _eigh_2x2(A, eigvals_only=True)
+
         return self.eigendecomposition["eigval"]
 
     @staticmethod
@@ -321,7 +497,15 @@ class SparseHamiltonian(Operator):
         if not isinstance(value, (int, float)) and qml.math.ndim(value) != 0:
             raise TypeError(f"Scalar value must be an int or float. Got {type(value)}")
 
-        return qml.SparseHamiltonian(csr_matrix.multiply(self.H, value), wires=self.wires)
+        # scaling only touches the data, so the index arrays are shared with the original matrix
+        # unless they are not in canonical format and may still be reordered in place
+        H = self.H
+        indices, indptr = H.indices, H.indptr
+        if not H.has_canonical_format:
+            indices, indptr = indices.copy(), indptr.copy()
+
+        new_H = csr_matrix((H.data * value, indices, indptr), shape=H.shape, copy=False)
+        return qml.SparseHamiltonian(new_H, wires=self.wires)
 
     __rmul__ = __mul__
 
@@ -364,6 +548,12 @@ class SparseHamiltonian(Operator):
         >>> type(res)
         <class 'numpy.ndarray'>
         """
+        if H.shape[0] > 2**_MAX_DENSE_SPARSE_HAMILTONIAN_WIRES:
+            warnings.warn(
+                "Computing the dense matrix of a SparseHamiltonian on this many wires may use a "
+                "large amount of memory. Consider using SparseHamiltonian.sparse_matrix instead.",
+                UserWarning,
+            )
         return H.toarray()
 
     # pylint: disable=arguments-differ
@@ -506,6 +696,8 @@ class BasisStateProjector(Projector, Operation):
 
     grad_method = None
     _queue_category = "_ops"
+    _label_cache = None
+    _index_cache = None
 
     # The call signature should be the same as Projector.__new__ for the positional
     # arguments, but with free key word arguments.
@@ -555,8 +747,29 @@ class BasisStateProjector(Projector, Operation):
 
         if base_label is not None:
             return base_label
-        basis_string = "".join(str(int(i)) for i in self.data[0])
-        return f"|{basis_string}⟩⟨{basis_string}|"
+
+        # the label only depends on the basis state, so it is cached until the data changes
+        basis_state = self.data[0]
+        if self._label_cache is None or self._label_cache[0] is not basis_state:
+            basis_string = "".join(str(int(i)) for i in basis_state)
+            self._label_cache = (basis_state, f"|{basis_string}⟩⟨{basis_string}|")
+        return self._label_cache[1]
+
+    def _index(self) -> int:
+        """Index of the projected basis state, cached until the data changes."""
+        basis_state = self.data[0]
+        if self._index_cache is None or self._index_cache[0] is not basis_state:
+            self._index_cache = (basis_state, _basis_state_index(basis_state))
+        return self._index_cache[1]
+
+    def eigvals(self) -> TensorLike:
+        # traced basis states have no concrete index to cache
+        if not isinstance(self.data[0], np.ndarray):
+            return super().eigvals()
+
+        w = np.zeros(2 ** len(self.data[0]))
+        w[self._index()] = 1
+        return w
 
     @staticmethod
     def compute_matrix(basis_state: TensorLike) -> np.ndarray:  # pylint: disable=arguments-differ
@@ -581,6 +794,15 @@ class BasisStateProjector(Projector, Operation):
          [0. 0. 0. 0.]
          [0. 0. 0. 0.]]
         """
+        # the projector has a single non-zero entry, so a dense matrix is mostly wasted memory
+        if len(basis_state) > _MAX_DENSE_PROJECTOR_WIRES:
+            warnings.warn(
+                "Computing the dense matrix of a basis state projector on this many wires may "
+                "use a large amount of memory. Consider using BasisStateProjector.sparse_matrix "
+                "instead.",
+                UserWarning,
+            )
+
         shape = (2 ** len(basis_state), 2 ** len(basis_state))
         if qml.math.get_interface(basis_state) == "jax":
             idx = 0
@@ -590,7 +812,7 @@ class BasisStateProjector(Projector, Operation):
             return mat.at[idx, idx].set(1.0)
 
         m = np.zeros(shape)
-        idx = int("".join(str(i) for i in basis_state), 2)
+        idx = _basis_state_index(basis_state)
         m[idx, idx] = 1
         return m
 
@@ -627,7 +849,7 @@ class BasisStateProjector(Projector, Operation):
             eigvals = qml.math.zeros(2 ** len(basis_state), like=basis_state)
             return eigvals.at[idx].set(1.0)
         w = np.zeros(2 ** len(basis_state))
-        idx = int("".join(str(i) for i in basis_state), 2)
+        idx = _basis_state_index(basis_state)
         w[idx] = 1
         return w
 
@@ -674,13 +896,15 @@ class BasisStateProjector(Projector, Operation):
             scipy.sparse.csr_matrix: The sparse CSR matrix representation of the projector.
         """
 
-        num_qubits = len(basis_state)
-        data = [1]
-        rows = [int("".join(str(bit) for bit in basis_state), 2)]
-        cols = rows
-        return csr_matrix((data, (rows, cols)), shape=(2**num_qubits, 2**num_qubits)).asformat(
-            format
-        )
+        dim = 2 ** len(basis_state)
+        idx = _basis_state_index(basis_state)
+        # build the CSR arrays directly, skipping the COO sort for a single entry
+        index_dtype = np.int32 if dim <= np.iinfo(np.int32).max else np.int64
+        indptr = np.zeros(dim + 1, dtype=index_dtype)
+        indptr[idx + 1 :] = 1
+        indices = np.array([idx], dtype=index_dtype)
+        data = np.ones(1, dtype=int)
+        return csr_matrix((data, indices, indptr), shape=(dim, dim)).asformat(format)
 
 
 class StateVectorProjector(Projector):
@@ -688,6 +912,9 @@ class StateVectorProjector(Projector):
     :math:`\phi` denotes a state."""
 
     grad_method = None
+    _label_cache = None
+    _householder_cache = LRUCache(maxsize=64)
+    _householder_cache_max_wires = 8
 
     # The call signature should be the same as Projector.__new__ for the positional
     # arguments, but with free key word arguments.
@@ -695,6 +922,21 @@ class StateVectorProjector(Projector):
         wires = Wires(wires)
         super().__init__(state, wires=wires, id=id)
 
+    @staticmethod
+    def _cached_householder_unitary(state_vector: np.ndarray) -> np.ndarray:
+        """Householder unitary of a NumPy state vector, cached in a least recently used cache for
+        states of up to ``StateVectorProjector._householder_cache_max_wires`` wires. A copy of the
+        cached unitary is returned, so that callers are free to modify it."""
+        if len(state_vector) > 2**StateVectorProjector._householder_cache_max_wires:
+            return _householder_unitary(state_vector)
+
+        cache = StateVectorProjector._householder_cache
+        key = (state_vector.shape, state_vector.dtype.str, state_vector.tobytes())
+        u = cache.get(key)
+        if u is None:
+            u = cache[key] = _householder_unitary(state_vector)
+        return u.copy()
+
     def __new__(cls, *_, **__):
         return object.__new__(cls)
 
@@ -739,13 +981,18 @@ class StateVectorProjector(Projector):
         if base_label is not None:
             return base_label
 
-        state_vector = self.parameters[0]
-        n_wires = int(qml.math.log2(len(state_vector)))
-        basis_state_idx = qml.math.nonzero(state_vector)[0]
+        state_vector = self.data[0]
+        if self._label_cache is None or self._label_cache[0] is not state_vector:
+            n_wires = int(qml.math.log2(len(state_vector)))
+            basis_state_idx = qml.math.nonzero(state_vector)[0]
+            basis_label = None
+            if len(basis_state_idx) == 1:
+                basis_string = f"{basis_state_idx[0]:0{n_wires}b}"
+                basis_label = f"|{basis_string}⟩⟨{basis_string}|"
+            self._label_cache = (state_vector, basis_label)
 
-        if len(basis_state_idx) == 1:
-            basis_string = f"{basis_state_idx[0]:0{n_wires}b}"
-            return f"|{basis_string}⟩⟨{basis_string}|"
+        if self._label_cache[1] is not None:
+            return self._label_cache[1]
 
         if cache is None or not isinstance(cache.get("matrices", None), list):
             return "P"
@@ -781,8 +1028,42 @@ class StateVectorProjector(Projector):
          [0. 0.5 0.5 0.]
          [0. 0.  0.  0.]]
         """
+        if qml.math.get_interface(state_vector) == "numpy":
+            state_vector = np.asarray(state_vector)
+            nonzero = np.flatnonzero(state_vector)
+            # for states with few non-zero amplitudes, only fill in the non-zero block
+            if len(nonzero) ** 2 <= len(state_vector):
+                amplitudes = state_vector[nonzero]
+                mat = np.zeros((len(state_vector), len(state_vector)), dtype=state_vector.dtype)
+                mat[np.ix_(nonzero, nonzero)] = np.outer(amplitudes, np.conj(amplitudes))
+                return mat
+            return state_vector[:, None] * np.conj(state_vector)
+
         return qml.math.outer(state_vector, qml.math.conj(state_vector))
 
+    @staticmethod
+    def compute_sparse_matrix(  # pylint: disable=arguments-differ
+        state_vector: TensorLike, format="csr"
+    ) -> spmatrix:
+        """
+        Computes the sparse CSR matrix representation of the projector onto the state vector.
+
+        Args:
+            state_vector (Iterable): state vector to project on
+
+        Returns:
+            scipy.sparse.csr_matrix: The sparse CSR matrix representation of the projector.
+        """
+        state_vector = qml.math.toarray(state_vector)
+        nonzero = np.flatnonzero(state_vector)
+        amplitudes = state_vector[nonzero]
+
+        data = np.outer(amplitudes, np.conj(amplitudes)).ravel()
+        rows = np.repeat(nonzero, len(nonzero))
+        cols = np.tile(nonzero, len(nonzero))
+        shape = (len(state_vector), len(state_vector))
+        return csr_matrix((data, (rows, cols)), shape=shape).asformat(format)
+
     @staticmethod
     def compute_eigvals(  # pylint: disable=arguments-differ
         state_vector: TensorLike,
@@ -811,8 +1092,13 @@ class StateVectorProjector(Projector):
         >>> StateVectorProjector.compute_eigvals([0, 0, 1, 0])
         array([1, 0, 0, 0])
         """
-        precision = qml.math.get_dtype_name(state_vector)[-2:]
-        dtype = f"float{precision}" if precision in {"32", "64"} else "float64"
+        if type(state_vector) is np.ndarray:  # pylint: disable=unidiomatic-typecheck
+            dtype = np.float32 if state_vector.dtype in _SINGLE_PRECISION_DTYPES else np.float64
+            w = np.zeros(state_vector.shape, dtype=dtype)
+            w[0] = 1
+            return w
+
+        dtype = np.float32 if qml.math.get_dtype_name(state_vector).endswith("32") else np.float64
         w = np.zeros(qml.math.shape(state_vector), dtype=dtype)
         w[0] = 1
         return qml.math.convert_like(w, state_vector)
@@ -844,31 +1130,68 @@ class StateVectorProjector(Projector):
         >>> StateVectorProjector.compute_diagonalizing_gates(state_vector, wires=[0])
         [QubitUnitary(array([[ 0.70710678+0.j        ,  0.        -0.70710678j],
                              [ 0.        +0.70710678j, -0.70710678+0.j        ]]), wires=[0])]
+
+        Projectors onto computational basis states given as NumPy arrays are diagonalized by
+        flipping the set bits:
+
+        >>> StateVectorProjector.compute_diagonalizing_gates(np.array([0, 0, 0, 1j]), wires=[0, 1])
+        [X(0), X(1)]
         """
         # Adapting the approach discussed in the link below to work with arbitrary complex-valued state vectors.
         # Alternatively, we could take the adjoint of the Mottonen decomposition for the state vector.
         # https://quantumcomputing.stackexchange.com/questions/10239/how-can-i-fill-a-unitary-knowing-only-its-first-column
 
-        if qml.math.get_interface(state_vector) == "tensorflow":
+        interface = qml.math.get_interface(state_vector)
+        if interface == "numpy":
+            state_vector = np.asarray(state_vector)
+            nonzero = np.flatnonzero(state_vector)
+            if len(nonzero) == 1:
+                # a basis state |k> is mapped onto |0> by flipping the set bits of k
+                wires = Wires(wires)
+                index = int(nonzero[0])
+                return [
+                    PauliX(wire)
+                    for i, wire in enumerate(wires)
+                    if (index >> (len(wires) - 1 - i)) & 1
+                ]
+
+            u = StateVectorProjector._cached_householder_unitary(state_vector)
+            return [QubitUnitary(u, wires=wires)]
+
+        if interface == "tensorflow":
             dtype_name = qml.math.get_dtype_name(state_vector)
             if dtype_name == "int32":
                 state_vector = qml.math.cast(state_vector, np.complex64)
             elif dtype_name == "int64":
                 state_vector = qml.math.cast(state_vector, np.complex128)
 
-        angle = qml.math.angle(state_vector[0])
-        if qml.math.get_interface(angle) == "tensorflow":
-            if qml.math.get_dtype_name(angle) == "float32":
-                angle = qml.math.cast(angle, np.complex64)
-            else:
-                angle = qml.math.cast(angle, np.complex128)
-
-        phase = qml.math.exp(-1.0j * angle)
-        psi = phase * state_vector
-        denominator = qml.math.sqrt(2 + 2 * psi[0])
-        summed_array = np.zeros(qml.math.shape(psi), dtype=qml.math.get_dtype_name(psi))
-        summed_array[0] = 1.0
-        psi = psi + summed_array
-        psi /= denominator
-        u = 2 * qml.math.outer(psi, qml.math.conj(psi)) - qml.math.eye(len(psi))
+        # The global phase conj(p0) / |p0| is computed without trigonometric functions. The modulus
+        # is taken as sqrt(p0 * conj(p0)) so that it keeps the complex dtype of the state, and a
+        # vanishing first amplitude is replaced by one before the square root and the division,
+        # so that the phase and its gradient stay finite.
+        p0 = state_vector[0]
+        r0_squared = p0 * qml.math.conj(p0)
+        is_zero = r0_squared == 0
+        one = qml.math.ones_like(p0)
+        phase = qml.math.where(is_zero, one, qml.math.conj(p0)) / qml.math.sqrt(
+            qml.math.where(is_zero, one, r0_squared)
+        )
+        # as on the NumPy path, sqrt(2) is folded into the normalization of the Householder vector,
+        # so that the phase and the normalization are applied in one pass and 2|v><v| is a plain
+        # outer product
+        scale = 1 / qml.math.sqrt(1 + phase * p0)
+        psi = state_vector * (phase * scale)
+        psi = qml.math.scatter_element_add(psi, (0,), scale)
+        u = qml.math.outer(psi, qml.math.conj(psi))
+        if interface == "torch":
+            # the fresh product can be shifted in place along its diagonal, which also keeps
+            # the identity from being built as a dense matrix
+            u.diagonal().sub_(1)
+        else:
+            # the identity is created by the framework of the state, so that it is allocated on
+            # the same device instead of being copied over from a NumPy array
+            eye = qml.math.eye(len(psi), like=psi)
+            if interface == "tensorflow":
+                eye = qml.math.cast(eye, qml.math.get_dtype_name(psi))
+            u = u - eye
         return [QubitUnitary(u, wires=wires)]
@@ -14,9 +14,11 @@
 """
 Utility functions to convert between ``~.PauliSentence`` and other PennyLane operators.
 """
+
 from functools import reduce, singledispatch
 from itertools import product
-from operator import matmul
+
+import numpy as np
 
 import pennylane as qml
 from pennylane.math.utils import is_abstract
@@ -26,6 +28,36 @@ from pennylane.ops.qubit.matrix_ops import _walsh_hadamard_transform
 from .pauli_arithmetic import I, PauliSentence, PauliWord, X, Y, Z, op_map
 from .utils import is_pauli_word
 
+# maps the entries (00, 01, 10, 11) of a 2x2 block to the coefficients of (I, X, Y, Z)
+_PAULI_BLOCK_TRANSFORM = 0.5 * np.array(
+    [[1, 0, 0, 1], [0, 1, 1, 0], [0, 1j, -1j, 0], [1, 0, 0, -1]], dtype=complex
+)
+
+
+def _tensorized_pauli_coefficients(matrix, num_qubits):
+    r"""Computes the coefficients of all Pauli words in a :math:`2^n\times 2^n` NumPy matrix.
+
+    Following the tensorized Pauli decomposition (`arXiv:2310.13421
+    <https://arxiv.org/abs/2310.13421>`_), the row and column index of each qubit are combined
+    into a single axis holding the four entries of a :math:`2\times 2` block, which is then mapped
+    to the coefficients of ``I``, ``X``, ``Y`` and ``Z`` one qubit at a time. Each step is a
+    single vectorized contraction over the whole matrix, so no per-term Python work is needed.
+
+    Args:
+        matrix (array[complex]): matrix of shape ``(2**num_qubits, 2**num_qubits)``
+        num_qubits (int): number of qubits the matrix acts on
+
+    Returns:
+        array[complex]: coefficients of shape ``(4,) * num_qubits``, where the index along each
+        axis selects ``I``, ``X``, ``Y`` or ``Z`` on the corresponding qubit
+    """
+    tensor = np.reshape(matrix, (2,) * (2 * num_qubits))
+    tensor = np.transpose(tensor, [ax for k in range(num_qubits) for ax in (k, k + num_qubits)])
+    tensor = np.reshape(tensor, (4,) * num_qubits)
+    for k in range(num_qubits):
+        tensor = _PAULI_BLOCK_TRANSFORM @ np.reshape(tensor, (4**k, 4, -1))
+    return np.reshape(tensor, (4,) * num_qubits)
+
 
 def _generalized_pauli_decompose(
     matrix, hide_identity=False, wire_order=None, pauli=False, padding=False
@@ -160,6 +192,50 @@ def _generalized_pauli_decompose(
     if wire_order is None:
         wire_order = range(num_qubits)
 
+    if qml.math.get_interface(matrix) == "numpy":
+        coeff_tensor = _tensorized_pauli_coefficients(matrix, num_qubits)
+        # skip the same (near) zero coefficients as the generic path below
+        terms = (
+            (tuple("IXYZ"[i] for i in idx), coeff_tensor[tuple(idx)])
+            for idx in np.argwhere(~(np.abs(coeff_tensor) <= 1e-8))
+        )
+    else:
+        terms = _walsh_hadamard_pauli_terms(matrix, num_qubits)
+
+    # Obtain the coefficients for each Pauli word
+    coeffs, obs = [], []
+    for pauli_rep, coefficient in terms:
+        observables = (
+            [(o, w) for w, o in zip(wire_order, pauli_rep) if o != I]
+            if hide_identity and not all(t == I for t in pauli_rep)
+            else [(o, w) for w, o in zip(wire_order, pauli_rep)]
+        )
+        if observables:
+            coeffs.append(coefficient)
+            obs.append(observables)
+
+    coeffs = qml.math.stack(coeffs)
+
+    if not pauli:
+        with qml.QueuingManager.stop_recording():
+            obs = [_pauli_word_op([op_map[o](w) for o, w in obs_term]) for obs_term in obs]
+
+    return (coeffs, obs)
+
+
+def _pauli_word_op(factors):
+    """Flat product of single-qubit Pauli operators, equivalent to ``reduce(matmul, factors)``
+    without building the intermediate nested products."""
+    if len(factors) == 1:
+        return factors[0]
+    return Prod(*factors)
+
+
+def _walsh_hadamard_pauli_terms(matrix, num_qubits):
+    """Yields the Pauli words of a square matrix with non-zero coefficients, together with
+    the coefficients, using a Walsh-Hadamard transform that supports all interfaces."""
+    shape = qml.math.shape(matrix)
+
     # Permute by XORing
     indices = [qml.math.array(range(shape[0]))]
     for idx in range(shape[0] - 1):
@@ -187,7 +263,6 @@ def _generalized_pauli_decompose(
     term_mat = qml.math.transpose(qml.math.multiply(hadamard_transform_mat, phase_mat))
 
     # Obtain the coefficients for each Pauli word
-    coeffs, obs = [], []
     for pauli_rep in product("IXYZ", repeat=num_qubits):
         bit_array = qml.math.array(
             [[(rep in "YZ"), (rep in "XY")] for rep in pauli_rep], dtype=int
@@ -197,22 +272,7 @@ def _generalized_pauli_decompose(
         if not is_abstract(matrix) and qml.math.allclose(coefficient, 0):
             continue
 
-        observables = (
-            [(o, w) for w, o in zip(wire_order, pauli_rep) if o != I]
-            if hide_identity and not all(t == I for t in pauli_rep)
-            else [(o, w) for w, o in zip(wire_order, pauli_rep)]
-        )
-        if observables:
-            coeffs.append(coefficient)
-            obs.append(observables)
-
-    coeffs = qml.math.stack(coeffs)
-
-    if not pauli:
-        with qml.QueuingManager.stop_recording():
-            obs = [reduce(matmul, [op_map[o](w) for o, w in obs_term]) for obs_term in obs]
-
-    return (coeffs, obs)
+        yield pauli_rep, coefficient
 
 
 def pauli_decompose(
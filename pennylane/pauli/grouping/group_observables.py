@@ -432,6 +432,23 @@ def compute_partition_indices(
     return _compute_partition_indices_rlf(observables, grouping_type=grouping_type)
 
 
+def _compute_partition_indices_from_binary(
+    observables: list, binary_matrix: np.ndarray, grouping_type: str = "qwc", method: str = "lf"
+) -> tuple[tuple[int]]:
+    """Computes the partition indices of a list of observables whose symplectic representation
+    has already been computed, skipping the conversion done by ``compute_partition_indices``.
+
+    The columns of ``binary_matrix`` may follow any wire order, as long as it is the same for all
+    rows. The ``'rlf'`` method is not supported, since it converts back from the binary matrix.
+    """
+    pauli_groupper = PauliGroupingStrategy(
+        observables, grouping_type=grouping_type, graph_colourer=method
+    )
+    pauli_groupper.binary_observables = binary_matrix
+
+    return pauli_groupper.idx_partitions_from_graph()
+
+
 def _compute_partition_indices_rlf(observables: list, grouping_type: str):
     """Computes the partition indices of a list of observables using a specified grouping type and 'rlf' method.
 
@@ -129,6 +129,9 @@ class Wires(Sequence):
             raise TypeError("Must specify a set of wires. None is not a valid wire label.")
         if _override:
             self._labels = wires
+        elif isinstance(wires, Wires):
+            # the labels of an existing Wires object are already validated
+            self._labels = wires._labels
         else:
             self._labels = _process(wires)
 
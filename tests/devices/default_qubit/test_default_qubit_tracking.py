@@ -199,6 +199,8 @@ shot_testing_combos = [
     ([qml.expval(qml.X(0)), qml.expval(qml.Y(0))], 2, 20),
     # Hamiltonian test cases
     ([qml.expval(qml.Hamiltonian([1, 0.5, 1], [qml.X(0), qml.Y(0), qml.X(1)]))], 2, 20),
+    ([qml.expval(qml.Hamiltonian([1, 1, 1], [qml.X(0), qml.Y(1), qml.Z(1)]))], 2, 20),
+    ([qml.expval(qml.Hamiltonian([1, 0.5], [qml.X(0), qml.X(0)]))], 1, 10),
     ([qml.expval(qml.Hamiltonian([1, 1], [qml.X(0), qml.X(1)], grouping_type="qwc"))], 1, 10),
     ([qml.expval(qml.Hamiltonian([1, 1], [qml.X(0), qml.Y(0)], grouping_type="qwc"))], 2, 20),
     # op arithmetic test cases
@@ -13,6 +13,9 @@
 # limitations under the License.
 """Unit tests for sample_state in devices/qubit."""
 
+import gc
+import weakref
+from copy import copy
 from random import shuffle
 
 import numpy as np
@@ -20,7 +23,15 @@ import pytest
 
 import pennylane as qml
 from pennylane.devices.qubit import measure_with_samples, sample_state, simulate
-from pennylane.devices.qubit.sampling import sample_probs
+from pennylane.devices.qubit.sampling import (
+    _get_num_qwc_groups_for_sum,
+    _get_num_wire_groups_for_expval_H,
+    _group_measurement_indices,
+    _group_measurements,
+    _unpack_samples,
+    get_num_shots_and_executions,
+    sample_probs,
+)
 from pennylane.devices.qubit.simulate import _FlexShots
 from pennylane.measurements import Shots
 
@@ -154,9 +165,12 @@ class TestSampleState:
         approx_probs = samples_to_probs(samples, n)
         assert np.allclose(approx_probs, expected_probs, atol=APPROX_ATOL)
 
-    def test_entangled_qubit_samples_always_match(self):
-        """Tests that entangled qubits are always in the same state."""
-        bell_state = np.array([[1, 0], [0, 1]]) / np.sqrt(2)
+    @pytest.mark.all_interfaces
+    @pytest.mark.parametrize("interface", ["numpy", "autograd", "jax", "torch", "tensorflow"])
+    def test_entangled_qubit_samples_always_match(self, interface):
+        """Tests that entangled qubits are always in the same state, for real states in all
+        interfaces."""
+        bell_state = qml.math.array(np.array([[1, 0], [0, 1]]) / np.sqrt(2), like=interface)
         samples = sample_state(bell_state, 1000)
         assert samples.shape == (1000, 2)
         assert not any(samples[:, 0] ^ samples[:, 1])  # all samples are entangled
@@ -509,6 +523,146 @@ class TestMeasureSamples:
         assert result.shape == ()
         assert result == -1.0
 
+    def test_grouping_is_cached(self, mocker):
+        """Test that grouping the same measurements a second time reuses the cached groups."""
+        _group_measurement_indices.cache_clear()
+        mps = [qml.expval(qml.X(0)), qml.expval(qml.Y(1)), qml.expval(qml.Z(0)), qml.sample()]
+        tape = qml.tape.QuantumScript([], mps, shots=10)
+        spy = mocker.spy(qml.devices.qubit.sampling, "_compute_partition_indices_from_binary")
+
+        get_num_shots_and_executions(tape)
+        results = measure_with_samples(tape.measurements, two_qubit_state, tape.shots)
+
+        assert spy.call_count == 1
+        assert len(results) == 4
+        assert results[3].shape == (10, 2)
+
+    def test_grouping_cache_not_modified_by_callers(self):
+        """Test that modifying the returned group indices does not change the cached groups."""
+        mps = [qml.expval(qml.X(0)), qml.expval(qml.Y(1)), qml.expval(qml.Z(0))]
+        _, indices = _group_measurements(mps)
+        expected = [list(group) for group in indices]
+        indices[0].append(5)
+        indices.pop()
+
+        assert _group_measurements(mps)[1] == expected
+
+    def test_grouping_cache_does_not_keep_observables(self):
+        """Test that the grouping cache does not keep the measured observables alive."""
+        obs = qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0]), wires=[0, 1])
+        obs_ref = weakref.ref(obs)
+        _group_measurements([qml.expval(obs), qml.expval(qml.X(0))])
+
+        del obs
+        gc.collect()
+        assert obs_ref() is None
+
+    def test_num_executions_is_cached(self, mocker):
+        """Test that the number of executions of an observable is only computed once
+        for equal observables."""
+        _get_num_qwc_groups_for_sum.cache_clear()
+        spy = mocker.spy(qml.pauli, "group_observables")
+        observables = [qml.X(0) + qml.Y(0) + 0.37 * qml.Z(1) for _ in range(2)]
+        for obs in observables:
+            tape = qml.tape.QuantumScript([], [qml.expval(obs)], shots=10)
+            assert get_num_shots_and_executions(tape) == (2, 20)
+
+        assert spy.call_count == 1
+
+    def test_num_executions_cache_hash_collision(self, monkeypatch):
+        """Test that the cached number of executions of an observable is not returned for a
+        different observable with the same hash."""
+        _get_num_wire_groups_for_expval_H.cache_clear()
+        H_1 = qml.Hamiltonian([1.0, 1.0], [qml.X(0), qml.X(1)])
+        H_2 = qml.Hamiltonian([1.0, 1.0], [qml.X(0), qml.Z(0)])
+        monkeypatch.setattr(type(H_1), "hash", property(lambda self: 0))
+
+        assert _get_num_wire_groups_for_expval_H(H_1) == 1
+        assert _get_num_wire_groups_for_expval_H(H_2) == 2
+
+    def test_num_executions_cache_does_not_keep_observables(self):
+        """Test that the cached number of executions does not keep the observables alive."""
+        _get_num_wire_groups_for_expval_H.cache_clear()
+        H = qml.Hamiltonian([0.5, 1.5], [qml.X(0), qml.Hermitian(np.eye(2), wires=1)])
+        H_ref = weakref.ref(H)
+        tape = qml.tape.QuantumScript([], [qml.expval(H)], shots=10)
+        assert get_num_shots_and_executions(tape) == (1, 10)
+
+        del H, tape
+        gc.collect()
+        assert H_ref() is None
+
+    def test_computational_basis_skips_diagonalization(self, mocker):
+        """Test that no diagonalizing gates are computed or applied when all the observables
+        are already diagonal in the computational basis."""
+        mps = [qml.expval(qml.Z(0)), qml.var(qml.Z(0) @ qml.Z(1)), qml.sample(wires=[0, 1])]
+        spy_diag = mocker.spy(qml.pauli, "diagonalize_qwc_pauli_words")
+        spy_apply = mocker.spy(qml.devices.qubit.sampling, "apply_operation")
+
+        results = measure_with_samples(mps, two_qubit_state, Shots(10))
+
+        spy_diag.assert_not_called()
+        spy_apply.assert_not_called()
+        assert results[2].shape == (10, 2)
+
+    def test_sample_overlapping_z_sum(self):
+        """Test that sampling a sum of overlapping Z observables, which is a single pauli word but
+        has its eigenvalues ordered by its diagonalizing gates, returns the right eigenvalues."""
+        state = np.array([1.0, 0.0])
+        results = measure_with_samples([qml.sample(qml.Z(0) + qml.Z(0))], state, Shots(10))
+        assert np.array_equal(results[0], np.full(10, 2.0))
+
+    def test_equal_shot_bins_processed_at_once(self, mocker, seed):
+        """Test that expectation values and variances are computed for all the shot bins at once
+        when the bins have equal sizes."""
+        mps = [qml.expval(qml.Z(0)), qml.var(qml.Z(1))]
+        spy_expval = mocker.spy(qml.measurements.ExpectationMP, "process_samples")
+        spy_var = mocker.spy(qml.measurements.VarianceMP, "process_samples")
+
+        results = measure_with_samples(mps, two_qubit_state, Shots((100, 100, 100)), rng=seed)
+
+        assert spy_expval.call_count == 1
+        assert spy_var.call_count == 1
+
+        samples = measure_with_samples([qml.sample()], two_qubit_state, Shots(300), rng=seed)[0]
+        eigvals = 1 - 2 * samples.reshape(3, 100, 2)
+        assert len(results) == 3
+        for res, bin_eigvals in zip(results, eigvals):
+            assert np.allclose(res[0], np.mean(bin_eigvals[:, 0]))
+            assert np.allclose(res[1], np.var(bin_eigvals[:, 1]))
+
+    def test_observables_simplified_once(self, mocker):
+        """Test that grouping the same measurements twice only simplifies their observables once,
+        including when the simplified observables are copied."""
+        mocker.patch("pennylane.devices.qubit.sampling._simplified_observables", weakref.WeakSet())
+        mps = [qml.expval(qml.prod(qml.X(0), qml.X(1))), qml.expval(qml.s_prod(2, qml.Y(0)))]
+        spy = mocker.spy(qml, "simplify")
+
+        groups, _ = _group_measurements(mps)
+        assert spy.call_count == 2
+        assert qml.equal(mps[1].obs, qml.s_prod(2.0, qml.Y(0)))
+
+        assert _group_measurements(mps)[0] == groups
+        assert spy.call_count == 2
+
+        _ = _group_measurements([qml.expval(copy(mp.obs)) for mp in mps])
+        assert spy.call_count == 2
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            [qml.X(0), qml.Z(0) @ qml.Y(1), qml.Y(1), 2 * qml.X(0) @ qml.X("a"), qml.I(1)],
+            [qml.Z(0), qml.Z(1), qml.Z(0) @ qml.Z(1)],
+        ],
+    )
+    def test_all_pauli_words_grouping(self, obs):
+        """Test that measurements whose observables are all pauli words are grouped
+        like ``compute_partition_indices`` partitions their observables."""
+        mps = [qml.expval(o) for o in obs]
+        expected = [list(group) for group in qml.pauli.compute_partition_indices(obs)]
+
+        assert _group_measurements(mps)[1] == expected
+
     def test_identity_on_no_wires(self):
         """Test that measure_with_samples can handle observables on no wires when no other measurements exist."""
 
@@ -1181,6 +1335,34 @@ class TestHamiltonianSamples:
         # Already tested the numeric accuracy in test_hamiltonian_expval
         # so we only check the shape here
 
+    @pytest.mark.parametrize("obs_fn", [qml.Hamiltonian, qml.dot])
+    def test_terms_sampled_once_for_all_shot_copies(self, obs_fn, mocker, seed):
+        """Test that each group of commuting terms is sampled a single time for all
+        the copies of a shot vector."""
+        obs = obs_fn([0.8, 0.5, 0.2], [qml.PauliZ(0), qml.PauliX(0), qml.PauliZ(0) @ qml.PauliZ(1)])
+        qs = qml.tape.QuantumScript([qml.RY(0.67, wires=0)], [qml.expval(obs)], shots=(100,) * 3)
+
+        spy = mocker.spy(qml.devices.qubit.sampling, "sample_state")
+        res = simulate(qs, rng=seed)
+
+        assert spy.call_count == 2
+        assert all(call.kwargs["shots"] == 300 for call in spy.call_args_list)
+        assert isinstance(res, tuple) and len(res) == 3
+
+    def test_pauli_terms_read_off_shared_samples(self, mocker):
+        """Test that the expectation values of pauli-word terms are computed from the parities
+        of the shared samples, and match those computed from their eigenvalues."""
+        obs = qml.X(0) + 0.3 * qml.Y(1) @ qml.Z(2) + qml.Z(1) + 0.5 * qml.Hadamard(0)
+        state = np.random.default_rng(7).normal(size=8).reshape((2, 2, 2))
+        state /= np.linalg.norm(state)
+
+        spy = mocker.spy(qml.devices.qubit.sampling, "_pauli_word_expval")
+        res = measure_with_samples([qml.expval(obs)], state, Shots(10000), rng=42)
+        assert spy.call_count == 3
+
+        expected = qml.devices.qubit.measure(qml.expval(obs), state)
+        assert np.allclose(res[0], expected, atol=0.05)
+
     def test_sum_expval(self, seed):
         """Test that sampling works well for Sum observables"""
 
@@ -1366,3 +1548,72 @@ class TestSampleProbs:
         )
         with pytest.raises(ValueError, match=r"(?i)probabilities do not sum to 1"):
             sample_probs(probs, shots=1000, num_wires=1, is_state_batched=True, rng=seed)
+
+    def test_batched_sampling_matches_choice(self, seed):
+        """Test that batched sampling draws the same samples as sampling each batch
+        element with ``rng.choice``."""
+        probs = np.array([[0.1, 0.2, 0.3, 0.4], [0.25, 0.0, 0.75, 0.0], [0.0, 0.0, 0.0, 1.0]])
+        samples = sample_probs(probs, shots=100, num_wires=2, is_state_batched=True, rng=seed)
+
+        rng = np.random.default_rng(seed)
+        expected = np.stack([rng.choice(4, 100, p=p) for p in probs])
+        assert qml.math.allclose(samples, [[[s >> 1, s & 1] for s in row] for row in expected])
+
+    @pytest.mark.parametrize("num_wires", [1, 3, 8, 33])
+    def test_unpack_samples(self, num_wires, seed):
+        """Test that integer samples are unpacked into bits with the most significant wire first."""
+        samples = np.random.default_rng(seed).integers(0, 2**num_wires, size=(2, 10))
+        bits = _unpack_samples(samples, num_wires)
+
+        powers_of_two = 1 << np.arange(num_wires, dtype=np.int64)[::-1]
+        assert bits.shape == (2, 10, num_wires)
+        assert bits.dtype == np.int64
+        assert np.array_equal(bits @ powers_of_two, samples)
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_sampling_more_shots_than_basis_states(self, is_state_batched, seed):
+        """Test sampling four or more wires with more shots than basis states, in which case the
+        samples are drawn from a multinomial distribution and shuffled."""
+        probs = np.zeros(16)
+        probs[[0, 5, 10, 15]] = [0.1, 0.2, 0.3, 0.4]
+        if is_state_batched:
+            probs = np.stack([probs, probs[::-1]])
+        samples = sample_probs(
+            probs, shots=10000, num_wires=4, is_state_batched=is_state_batched, rng=seed
+        )
+
+        assert samples.shape == probs.shape[:-1] + (10000, 4)
+        indices = samples @ np.array([8, 4, 2, 1])
+        for idx, p in zip(np.reshape(indices, (-1, 10000)), np.reshape(probs, (-1, 16))):
+            assert np.allclose(np.bincount(idx, minlength=16) / 10000, p, atol=0.02)
+            # the samples are shuffled rather than grouped by basis state
+            assert np.count_nonzero(np.diff(idx)) > 1000
+
+    @pytest.mark.parametrize("is_state_batched", [False, True])
+    def test_sampling_float32(self, is_state_batched, seed):
+        """Test that sampling in single precision gives integer samples from the right states."""
+        probs = np.zeros(16)
+        probs[[3, 9]] = 0.5
+        if is_state_batched:
+            probs = np.stack([probs, np.roll(probs, 1)])
+        samples = sample_probs(
+            probs,
+            shots=16,
+            num_wires=4,
+            is_state_batched=is_state_batched,
+            rng=seed,
+            sample_dtype=np.float32,
+        )
+
+        assert samples.shape == probs.shape[:-1] + (16, 4)
+        assert samples.dtype == np.int64
+        indices = samples @ np.array([8, 4, 2, 1])
+        for idx, p in zip(np.reshape(indices, (-1, 16)), np.reshape(probs, (-1, 16))):
+            assert set(idx) <= set(np.flatnonzero(p))
+
+    def test_sampling_float32_invalid_probs(self):
+        """Test that the norm of the probabilities is still validated in double precision
+        when sampling in single precision."""
+        probs = np.array([0.5, 0.5 + 1e-6])
+        with pytest.raises(ValueError, match="probabilities do not sum to 1"):
+            sample_probs(probs, 2, 1, False, 42, sample_dtype=np.float32)
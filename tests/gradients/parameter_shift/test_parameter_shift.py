@@ -16,6 +16,7 @@
 # pylint: disable=use-implicit-booleaness-not-comparison,abstract-method
 import pytest
 from default_qubit_legacy import DefaultQubitLegacy
+from scipy.sparse import csr_matrix
 
 import pennylane as qml
 from pennylane import numpy as np
@@ -26,6 +27,7 @@ from pennylane.gradients.parameter_shift import (
     _get_operation_recipe,
     _make_zero_rep,
     _put_zeros_in_pdA2_involutory,
+    _square_observable,
 )
 from pennylane.measurements.shots import Shots
 
@@ -2020,6 +2022,16 @@ class TestParameterShiftRule:
         assert gradA == pytest.approx(expected, abs=tol)
         assert gradF == pytest.approx(expected, abs=tol)
 
+    def test_square_sparse_hamiltonian(self):
+        """Tests that the square of a SparseHamiltonian used for variances stays sparse."""
+        A = np.array([[4, -1 + 6j], [-1 - 6j, 2]])
+        obs = qml.SparseHamiltonian(csr_matrix(A), wires=0)
+
+        squared = _square_observable(obs)
+
+        assert isinstance(squared, qml.SparseHamiltonian)
+        assert np.allclose(squared.sparse_matrix().toarray(), A @ A)
+
     def test_non_involutory_variance_multi_param(self, tol):
         """Tests a qubit Hermitian observable that is not involutory with multiple trainable parameters"""
         dev = qml.device("default.qubit", wires=1)
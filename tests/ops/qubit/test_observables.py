@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for qubit observables."""
+
 # pylint: disable=protected-access, use-implicit-booleaness-not-comparison, function-redefined
 import functools
 import pickle
 
 import numpy as np
 import pytest
+from cachetools import LRUCache
 from gate_data import H, I, X, Y, Z
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, lil_matrix
 
@@ -28,6 +30,7 @@ from pennylane.ops.qubit.observables import BasisStateProjector, StateVectorProj
 @pytest.fixture(autouse=True)
 def run_before_tests():
     qml.Hermitian._eigs = {}
+    StateVectorProjector._householder_cache.clear()
     yield
 
 
@@ -115,6 +118,12 @@ SPARSE_MATRIX_FORMATS = [
     ("csc", csc_matrix),
 ]
 
+
+def _eigs_key(observable):
+    """Key under which the eigendecomposition of ``observable`` is cached in ``Hermitian._eigs``."""
+    return (observable.shape, observable.dtype.str, observable.tobytes())
+
+
 projector_sv = [qml.Projector(np.array([0.5, 0.5, 0.5, 0.5]), [0, 1])]
 
 
@@ -237,7 +246,7 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = _eigs_key(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -254,15 +263,104 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         assert np.allclose(eigendecomp["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(eigendecomp["eigvec"], eigvecs, atol=tol, rtol=0)
 
-        key = tuple(observable.flatten().tolist())
+        key = _eigs_key(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
 
+    @pytest.mark.parametrize("seed", range(5))
+    def test_hermitian_eigendecomposition_closed_form(self, seed, tol):
+        """Tests that the closed-form 2x2 eigendecomposition agrees with numpy.linalg.eigh."""
+        rng = np.random.default_rng(seed)
+        A = rng.normal(size=(2, 2)) + 1j * rng.normal(size=(2, 2))
+        A = A + A.conj().T
+
+        eigendecomp = qml.Hermitian(A, wires=0).eigendecomposition
+        w, U = eigendecomp["eigval"], eigendecomp["eigvec"]
+        eigvals, eigvecs = np.linalg.eigh(A)
+
+        assert np.allclose(w, eigvals, atol=tol, rtol=0)
+        assert np.allclose(A @ U, U * w, atol=tol, rtol=0)
+        assert np.allclose(np.abs(U.conj().T @ eigvecs), np.eye(2), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("scale", [1e-200, 1e-160, 1e160, 1e300])
+    @pytest.mark.parametrize("observable", [X, Y, X + 0.5 * Z])
+    def test_hermitian_eigendecomposition_closed_form_scale(self, scale, observable):
+        """Tests that the closed-form 2x2 eigendecomposition is correct for matrices with very
+        small or very large entries."""
+        A = scale * observable
+
+        eigendecomp = qml.Hermitian(A, wires=0).eigendecomposition
+        w, U = eigendecomp["eigval"], eigendecomp["eigvec"]
+
+        assert np.allclose(w / scale, np.linalg.eigh(observable)[0])
+        assert np.allclose(A @ U / scale, U * w / scale)
+
+    @pytest.mark.parametrize(
+        "dtype, eigval_dtype",
+        [
+            (np.float32, np.float32),
+            (np.complex64, np.float32),
+            (np.float64, np.float64),
+            (np.complex128, np.float64),
+            (np.int64, np.float64),
+        ],
+    )
+    def test_hermitian_eigendecomposition_closed_form_dtype(self, dtype, eigval_dtype):
+        """Tests that the closed-form 2x2 eigendecomposition and eigenvalues keep the precision
+        of the matrix, as numpy.linalg.eigh does."""
+        A = np.array([[1, 2], [2, 3]], dtype=dtype)
+
+        eigendecomp = qml.Hermitian(A, wires=0).eigendecomposition
+        eigvals, eigvecs = np.linalg.eigh(A)
+
+        assert eigendecomp["eigval"].dtype == eigvals.dtype == eigval_dtype
+        assert eigendecomp["eigvec"].dtype == eigvecs.dtype
+        assert qml.Hermitian(A, wires=0).eigvals().dtype == eigval_dtype
+
+    @pytest.mark.parametrize("observable, eigvals, _", EIGVALS_TEST_DATA)
+    def test_hermitian_eigvals_closed_form(self, observable, eigvals, _, tol):
+        """Tests that single-qubit eigenvalues are computed without caching an eigendecomposition."""
+        res = qml.Hermitian(observable, 0).eigvals()
+
+        assert np.allclose(res, eigvals, atol=tol, rtol=0)
+        assert np.array_equal(res, qml.Hermitian(observable, 0).eigendecomposition["eigval"])
+        assert len(qml.Hermitian._eigs) == 1
+
+    def test_eigendecomposition_cache_is_bounded(self, monkeypatch):
+        """Tests that the eigendecomposition cache evicts the least recently used entries."""
+        monkeypatch.setattr(qml.Hermitian, "_eigs_max_size", 2)
+        obs_1, obs_2, obs_3 = (np.diag([1.0, float(i)]) for i in range(2, 5))
+
+        _ = qml.Hermitian(obs_1, wires=0).eigendecomposition
+        _ = qml.Hermitian(obs_2, wires=0).eigendecomposition
+        # a cache hit marks obs_1 as recently used, so obs_2 is evicted next
+        _ = qml.Hermitian(obs_1, wires=0).eigendecomposition
+        _ = qml.Hermitian(obs_3, wires=0).eigendecomposition
+
+        assert list(qml.Hermitian._eigs) == [_eigs_key(obs_1), _eigs_key(obs_3)]
+
+    def test_eigendecomposition_cache_is_bounded_in_bytes(self, monkeypatch):
+        """Tests that the eigendecomposition cache evicts entries beyond its byte budget, and
+        does not cache matrices larger than the budget."""
+        obs_1, obs_2, obs_3 = (np.diag([1.0, float(i)]) for i in range(2, 5))
+        eigs = qml.Hermitian(obs_1, wires=0).eigendecomposition
+        entry_nbytes = qml.Hermitian._eigs_nbytes(_eigs_key(obs_1), eigs)
+        monkeypatch.setattr(qml.Hermitian, "_eigs_max_bytes", 2 * entry_nbytes)
+
+        _ = qml.Hermitian(obs_2, wires=0).eigendecomposition
+        _ = qml.Hermitian(obs_3, wires=0).eigendecomposition
+        assert list(qml.Hermitian._eigs) == [_eigs_key(obs_2), _eigs_key(obs_3)]
+
+        large_obs = np.diag([1.0, 2.0, 3.0, 4.0])
+        res = qml.Hermitian(large_obs, wires=[0, 1]).eigendecomposition
+        assert np.allclose(res["eigval"], [1.0, 2.0, 3.0, 4.0])
+        assert list(qml.Hermitian._eigs) == [_eigs_key(obs_2), _eigs_key(obs_3)]
+
     @pytest.mark.parametrize("obs1", EIGVALS_TEST_DATA)
     @pytest.mark.parametrize("obs2", EIGVALS_TEST_DATA)
     def test_hermitian_eigvals_eigvecs_two_different_observables(self, obs1, obs2, tol):
-        """Tests that the eigvals method of the Hermitian class returns the correct results
+        """Tests that the eigendecomposition of the Hermitian class returns the correct results
         for two observables."""
         if np.all(obs1[0] == obs2[0]):
             pytest.skip("Test only runs for pairs of differing observable")
@@ -271,9 +369,9 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         observable_1_eigvals = obs1[1]
         observable_1_eigvecs = obs1[2]
 
-        key = tuple(observable_1.flatten().tolist())
+        key = _eigs_key(observable_1)
 
-        qml.Hermitian(observable_1, 0).eigvals()
+        _ = qml.Hermitian(observable_1, 0).eigendecomposition
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0
         )
@@ -286,9 +384,9 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         observable_2_eigvals = obs2[1]
         observable_2_eigvecs = obs2[2]
 
-        key_2 = tuple(observable_2.flatten().tolist())
+        key_2 = _eigs_key(observable_2)
 
-        qml.Hermitian(observable_2, 0).eigvals()
+        _ = qml.Hermitian(observable_2, 0).eigendecomposition
         assert np.allclose(
             qml.Hermitian._eigs[key_2]["eigval"], observable_2_eigvals, atol=tol, rtol=0
         )
@@ -301,15 +399,15 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
     def test_hermitian_eigvals_eigvecs_same_observable_twice(
         self, observable, eigvals, eigvecs, tol
     ):
-        """Tests that the eigvals method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
-        key = tuple(observable.flatten().tolist())
+        """Tests that the eigendecomposition of the Hermitian class keeps the same dictionary entries upon multiple calls."""
+        key = _eigs_key(observable)
 
-        qml.Hermitian(observable, 0).eigvals()
+        _ = qml.Hermitian(observable, 0).eigendecomposition
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
 
-        qml.Hermitian(observable, 0).eigvals()
+        _ = qml.Hermitian(observable, 0).eigendecomposition
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
         assert len(qml.Hermitian._eigs) == 1
@@ -379,13 +477,13 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         # pylint: disable=too-many-arguments
 
         # check calling `diagonalizing_gates` when `observable` is not in `_eigs` adds expected entry to `_eigs`
-        spy = mocker.spy(np.linalg, "eigh")
+        spy = mocker.spy(qml.ops.qubit.observables, "_eigh_2x2")
 
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
         assert spy.call_count == 1
 
-        key = tuple(observable.flatten().tolist())
+        key = _eigs_key(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -419,7 +517,7 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
 
         qubit_unitary = qml.Hermitian(observable_1, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_1.flatten().tolist())
+        key = _eigs_key(observable_1)
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0
         )
@@ -436,7 +534,7 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
 
         qubit_unitary_2 = qml.Hermitian(observable_2, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable_2.flatten().tolist())
+        key = _eigs_key(observable_2)
         assert np.allclose(
             qml.Hermitian._eigs[key]["eigval"], observable_2_eigvals, atol=tol, rtol=0
         )
@@ -454,7 +552,7 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         """Tests that the diagonalizing_gates method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = _eigs_key(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -463,7 +561,7 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
 
         qubit_unitary = qml.Hermitian(observable, wires=[0]).diagonalizing_gates()
 
-        key = tuple(observable.flatten().tolist())
+        key = _eigs_key(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -520,6 +618,33 @@ class TestHermitian:  # pylint: disable=too-many-public-methods
         assert np.allclose(res_static, expected, atol=tol)
         assert np.allclose(res_dynamic, expected, atol=tol)
 
+    def test_matrix_skips_revalidation(self, mocker):
+        """Test that the matrix of a constructed Hermitian is not validated a second time."""
+        A = np.diag([1.0, 2.0, 3.0, 4.0])
+        op = qml.Hermitian(A, wires=[0, 1])
+        spy = mocker.spy(qml.Hermitian, "_validate_input")
+
+        assert op.matrix() is A
+        assert np.allclose(op.matrix(wire_order=[1, 0]), np.diag([1.0, 3.0, 2.0, 4.0]))
+        assert np.allclose(op.matrix(wire_order=[0, 1, 2]), np.kron(A, np.eye(2)))
+        spy.assert_not_called()
+
+    def test_eigendecomposition_numpy_skips_conversion(self, mocker):
+        """Test that NumPy matrices are used directly when computing the eigendecomposition,
+        while other array types are still converted."""
+        spy = mocker.spy(qml.math, "to_numpy")
+        A = np.diag([1.0, 2.0, 3.0, 4.0])
+
+        res = qml.Hermitian(A, wires=[0, 1]).eigendecomposition
+        assert np.allclose(res["eigval"], [1.0, 2.0, 3.0, 4.0])
+        spy.assert_not_called()
+
+        res = qml.Hermitian(
+            qml.numpy.array(A, requires_grad=False), wires=[0, 1]
+        ).eigendecomposition
+        assert type(res["eigvec"]) is np.ndarray  # pylint: disable=unidiomatic-typecheck
+        spy.assert_called_once()
+
     @pytest.mark.jax
     def test_jit_execution(self):
         """Test that the Hermitian observable executes correctly under a jitted function."""
@@ -773,6 +898,23 @@ class TestBasisStateProjector:
         )
         assert diag_gates_static == []
 
+    @pytest.mark.parametrize("num_wires", [1, 8, 9, 17])
+    def test_projector_eigvals_index(self, num_wires):
+        """Tests that the basis state index is computed correctly across byte boundaries."""
+        basis_state = np.random.default_rng(num_wires).integers(0, 2, num_wires)
+        basis_state[0] = 1
+        expected_idx = int("".join(str(i) for i in basis_state), 2)
+
+        eigvals = BasisStateProjector.compute_eigvals(basis_state)
+        assert np.flatnonzero(eigvals).tolist() == [expected_idx]
+
+        sparse_mat = BasisStateProjector.compute_sparse_matrix(basis_state, format="coo")
+        assert sparse_mat.row.tolist() == sparse_mat.col.tolist() == [expected_idx]
+
+        csr_mat = BasisStateProjector.compute_sparse_matrix(basis_state)
+        assert csr_mat.has_canonical_format
+        assert csr_mat.nnz == 1 and csr_mat[expected_idx, expected_idx] == 1
+
     def test_projector_exceptions(self):
         """Tests that the projector construction raises the proper errors on incorrect inputs."""
         dev = qml.device("default.qubit", wires=2)
@@ -833,6 +975,15 @@ class TestBasisStateProjector:
         assert np.allclose(res_dynamic, expected, atol=tol)
         assert np.allclose(res_static, expected, atol=tol)
 
+    def test_matrix_representation_large_warning(self, monkeypatch):
+        """Test that a warning is raised when computing a dense matrix on many wires."""
+        monkeypatch.setattr(qml.ops.qubit.observables, "_MAX_DENSE_PROJECTOR_WIRES", 1)
+
+        with pytest.warns(UserWarning, match="Consider using BasisStateProjector.sparse_matrix"):
+            res = BasisStateProjector.compute_matrix([1, 0])
+
+        assert np.allclose(res, np.diag([0, 0, 1, 0]))
+
     def test_integration_batched_state(self):
         dev = qml.device("default.qubit", wires=1)
 
@@ -884,7 +1035,10 @@ class TestStateVectorProjector:
             state_vector, wires=range(num_wires)
         )
 
-        diagonalizing_matrices = [diag_gates[0].matrix(), diag_gates_static[0].matrix()]
+        diagonalizing_matrices = [
+            qml.matrix(qml.tape.QuantumScript(gates), wire_order=range(num_wires))
+            for gates in (diag_gates, diag_gates_static)
+        ]
         for u in diagonalizing_matrices:
             diagonal_matrix = u.conj().T @ proj.matrix() @ u
             assert np.allclose(
@@ -892,6 +1046,134 @@ class TestStateVectorProjector:
             )
             assert np.allclose(np.diagonal(diagonal_matrix), proj.eigvals(), atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("num_wires", [1, 2, 4])
+    @pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+    def test_diagonalizing_unitary(self, num_wires, dtype, seed, tol):
+        """Test that the diagonalizing unitary is a Hermitian reflection mapping the state
+        onto the first computational basis state."""
+        rng = np.random.default_rng(seed)
+        state_vector = rng.normal(size=2**num_wires).astype(dtype)
+        if np.iscomplexobj(state_vector):
+            state_vector += 1j * rng.normal(size=2**num_wires)
+        state_vector /= np.linalg.norm(state_vector)
+
+        (gate,) = StateVectorProjector.compute_diagonalizing_gates(
+            state_vector, wires=range(num_wires)
+        )
+        u = gate.matrix()
+
+        assert np.allclose(u, u.conj().T, atol=tol, rtol=0)
+        assert np.allclose(u @ u, np.eye(2**num_wires), atol=tol, rtol=0)
+        assert np.allclose(np.abs(u @ state_vector), np.eye(2**num_wires)[0], atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "state_vector, wires, expected",
+        [
+            (np.array([1, 0]), [0], []),
+            (np.array([0, 0, 0, 1j]), [0, 1], [qml.X(0), qml.X(1)]),
+            (-np.eye(8)[3], ["a", "b", "c"], [qml.X("b"), qml.X("c")]),
+        ],
+    )
+    def test_diagonalizing_gates_basis_state(self, state_vector, wires, expected):
+        """Test that projectors onto computational basis states are diagonalized with bit flips."""
+        diag_gates = StateVectorProjector.compute_diagonalizing_gates(state_vector, wires=wires)
+        assert diag_gates == expected
+
+        u = qml.matrix(qml.tape.QuantumScript(diag_gates), wire_order=wires)
+        assert np.allclose(np.abs(u @ state_vector), np.eye(len(state_vector))[0])
+
+    def test_probs_basis_state(self):
+        """Test the probabilities in the eigenbasis of a projector onto a computational basis
+        state, whose eigenvectors are permuted by flipping the set bits of the basis state."""
+        proj = qml.Projector(np.array([0, 0, 1, 0]), wires=[0, 1])
+
+        @qml.qnode(qml.device("default.qubit"))
+        def circuit():
+            qml.X(1)
+            return qml.probs(op=proj), qml.expval(proj)
+
+        probs, expval = circuit()
+        assert np.allclose(probs, [0, 0, 0, 1])
+        assert np.isclose(expval, 0)
+
+    def test_diagonalizing_unitary_cache(self, monkeypatch):
+        """Test that the diagonalizing unitaries of small NumPy states are cached with the least
+        recently used entries evicted."""
+        monkeypatch.setattr(StateVectorProjector, "_householder_cache", LRUCache(maxsize=2))
+        states = [np.array([1.0, x]) / np.sqrt(1 + x**2) for x in (1.0, 2.0, 3.0)]
+
+        u_1 = StateVectorProjector.compute_diagonalizing_gates(states[0], wires=0)[0].data[0]
+        _ = StateVectorProjector.compute_diagonalizing_gates(states[1], wires=0)
+        # a cache hit marks the first state as recently used, so the second is evicted next
+        (gate,) = StateVectorProjector.compute_diagonalizing_gates(states[0].copy(), wires=1)
+        _ = StateVectorProjector.compute_diagonalizing_gates(states[2], wires=0)
+
+        assert np.array_equal(gate.data[0], u_1)
+        assert gate.wires == qml.wires.Wires(1)
+        assert {key[2] for key in StateVectorProjector._householder_cache} == {
+            states[0].tobytes(),
+            states[2].tobytes(),
+        }
+
+    def test_diagonalizing_unitary_cache_returns_copies(self):
+        """Test that the cached diagonalizing unitaries are not shared with the gates, so that
+        their matrices can be modified without affecting the cache."""
+        state_vector = np.array([1.0, 1.0]) / np.sqrt(2)
+        expected = StateVectorProjector.compute_diagonalizing_gates(state_vector, wires=0)[0]
+        expected = expected.matrix()
+
+        (gate,) = qml.Projector(state_vector, wires=0).diagonalizing_gates()
+        (gate_2,) = qml.Projector(state_vector, wires=0).diagonalizing_gates()
+        assert gate.data[0] is not gate_2.data[0]
+        gate.data[0][:] = 0
+
+        (cached_u,) = StateVectorProjector._householder_cache.values()
+        assert np.array_equal(cached_u, expected)
+        assert np.array_equal(gate_2.matrix(), expected)
+        new_mat = qml.Projector(state_vector, wires=0).diagonalizing_gates()[0].matrix()
+        assert np.array_equal(new_mat, expected)
+
+    def test_diagonalizing_unitary_cache_skips_large_states(self, monkeypatch):
+        """Test that the diagonalizing unitaries of large states are not cached."""
+        monkeypatch.setattr(StateVectorProjector, "_householder_cache_max_wires", 1)
+        state_vector = np.array([1.0, 0.0, 0.0, 1.0]) / np.sqrt(2)
+
+        _ = StateVectorProjector.compute_diagonalizing_gates(state_vector, wires=[0, 1])
+        assert not StateVectorProjector._householder_cache
+
+    @pytest.mark.parametrize(
+        "interface",
+        [
+            pytest.param("autograd", marks=pytest.mark.autograd),
+            pytest.param("jax", marks=pytest.mark.jax),
+            pytest.param("torch", marks=pytest.mark.torch),
+            pytest.param("tensorflow", marks=pytest.mark.tf),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "state_vector",
+        [
+            np.array([0.6, 0.8j]),
+            np.array([1j, 0, 0, 1, 0, 0, 0, 0]) / np.sqrt(2),
+            np.array([0, 0.6, 0.8j, 0]),
+        ],
+    )
+    def test_diagonalizing_unitary_interfaces(self, state_vector, interface, tol):
+        """Test that the diagonalizing unitary agrees with the NumPy one for other interfaces."""
+        num_wires = int(np.log2(len(state_vector)))
+        expected = StateVectorProjector.compute_diagonalizing_gates(
+            state_vector, wires=range(num_wires)
+        )[0].matrix()
+
+        if interface == "autograd":
+            converted = qml.numpy.array(state_vector, requires_grad=True)
+        else:
+            converted = qml.math.asarray(state_vector, like=interface)
+        (gate,) = StateVectorProjector.compute_diagonalizing_gates(
+            converted, wires=range(num_wires)
+        )
+        assert np.allclose(qml.math.to_numpy(gate.matrix()), expected, atol=tol, rtol=0)
+
     @pytest.mark.parametrize("state_vector,expected", STATEVECTORPROJECTOR_TEST_DATA)
     def test_matrix_representation(self, state_vector, expected, tol):
         """Test that the matrix representation is defined correctly"""
@@ -901,6 +1183,44 @@ class TestStateVectorProjector:
         assert np.allclose(res_dynamic, expected, atol=tol)
         assert np.allclose(res_static, expected, atol=tol)
 
+    @pytest.mark.parametrize(
+        "dtype, expected_dtype",
+        [
+            (np.complex128, np.float64),
+            (np.complex64, np.float64),
+            (np.float32, np.float32),
+            (np.int64, np.float64),
+            (np.int32, np.float32),
+        ],
+    )
+    def test_eigvals_dtype(self, dtype, expected_dtype):
+        """Test that the eigenvalues are in single precision only for dtypes whose name ends in
+        32, for NumPy arrays and other interfaces alike."""
+        eigvals = StateVectorProjector.compute_eigvals(np.array([0, 1, 0, 0], dtype=dtype))
+        assert eigvals.dtype == expected_dtype
+        assert np.array_equal(eigvals, [1, 0, 0, 0])
+
+        state_vector = qml.numpy.array([0, 1, 0, 0], dtype=dtype, requires_grad=False)
+        eigvals = StateVectorProjector.compute_eigvals(state_vector)
+        assert qml.math.get_dtype_name(eigvals) == np.dtype(expected_dtype).name
+
+    @pytest.mark.parametrize(
+        "state_vector",
+        STATEVECTORPROJECTOR_TEST_STATES + [np.array([0.5, 0.5j, -0.5, 0.5]), np.eye(16)[5]],
+    )
+    @pytest.mark.parametrize("sparse_matrix_format", SPARSE_MATRIX_FORMATS)
+    def test_sparse_matrix_representation(self, state_vector, sparse_matrix_format):
+        """Test that the dense and sparse matrices agree with the full outer product."""
+        format, expected_type = sparse_matrix_format
+        expected = np.outer(state_vector, np.conj(state_vector))
+
+        res_dense = StateVectorProjector.compute_matrix(state_vector)
+        res_sparse = StateVectorProjector.compute_sparse_matrix(state_vector, format=format)
+
+        assert np.array_equal(res_dense, expected)
+        assert isinstance(res_sparse, expected_type)
+        assert np.array_equal(res_sparse.toarray(), expected)
+
     @pytest.mark.parametrize("projector", projector_sv)
     def test_label_matrices_not_in_cache(self, projector):
         """Test we obtain the correct label whenever "matrices" keyowrd is not in cache."""
@@ -959,6 +1279,44 @@ def test_label_method(op, label):
     assert op.label(base_label="obs") == "obs"
 
 
+def test_basis_state_projector_label_follows_data():
+    """Test that the cached basis state projector label is refreshed when the data changes."""
+    op = qml.Projector([1, 0], wires=(0, 1))
+    assert op.label() == "|10⟩⟨10|"
+
+    op.data = (np.array([0, 1]),)
+    assert op.label() == "|01⟩⟨01|"
+    assert qml.Projector([1, 1], wires=(0, 1)).label() == "|11⟩⟨11|"
+
+
+def test_state_vector_projector_label_follows_data(mocker):
+    """Test that the state vector projector label scans the state once and is refreshed
+    when the data changes."""
+    spy = mocker.spy(qml.math, "nonzero")
+    op = qml.Projector(np.array([0, 0, 1, 0]), wires=(0, 1))
+    assert op.label() == op.label() == "|10⟩⟨10|"
+    assert spy.call_count == 1
+
+    op.data = (np.array([1, 1, 0, 0]) / np.sqrt(2),)
+    assert op.label() == "P"
+    assert op.label(cache={"matrices": []}) == "P(M0)"
+    assert spy.call_count == 2
+
+
+def test_basis_state_projector_eigvals_cached_index(mocker):
+    """Test that the basis state index is computed once per data and reused by eigvals."""
+    spy = mocker.spy(qml.ops.qubit.observables, "_basis_state_index")
+    op = qml.Projector([1, 0], wires=(0, 1))
+
+    for _ in range(3):
+        assert np.allclose(op.eigvals(), [0, 0, 1, 0])
+    assert spy.call_count == 1
+
+    op.data = (np.array([0, 1]),)
+    assert np.allclose(op.eigvals(), [0, 1, 0, 0])
+    assert spy.call_count == 2
+
+
 def test_hermitian_labelling_w_cache():
     """Test hermitian matrix interacts with matrix cache provided to label."""
 
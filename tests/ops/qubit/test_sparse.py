@@ -14,6 +14,7 @@
 """
 Unit tests for the SparseHamiltonian observable.
 """
+
 import numpy as np
 import pytest
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, lil_matrix
@@ -208,6 +209,16 @@ class TestSparse:
         assert np.allclose(res_dynamic, sparse_hamiltonian, atol=tol, rtol=0)
         assert np.allclose(res_static, sparse_hamiltonian, atol=tol, rtol=0)
 
+    def test_matrix_large_warning(self, monkeypatch):
+        """Test that a warning is raised when computing a dense matrix on many wires."""
+        monkeypatch.setattr(qml.ops.qubit.observables, "_MAX_DENSE_SPARSE_HAMILTONIAN_WIRES", 1)
+        H = csr_matrix(np.eye(4))
+
+        with pytest.warns(UserWarning, match="Consider using SparseHamiltonian.sparse_matrix"):
+            res = qml.SparseHamiltonian(H, wires=(0, 1)).matrix()
+
+        assert np.allclose(res, np.eye(4))
+
     def test_sparse_diffmethod_error(self):
         """Test that an error is raised when the observable is SparseHamiltonian and the
         differentiation method is not parameter-shift."""
@@ -347,6 +358,20 @@ class TestSparse:
 
         assert np.allclose(H_sparse_mul_method.toarray(), H_sparse_multiplied_before.toarray())
 
+    @pytest.mark.parametrize("canonical", [True, False])
+    def test_scalar_multiplication_leaves_original_unchanged(self, canonical):
+        """Tests that scaling a SparseHamiltonian does not modify the original matrix."""
+        H = csr_matrix(([1.0, 2.0, 3.0], [1, 0, 1], [0, 2, 3]), shape=(2, 2))
+        if canonical:
+            H.sort_indices()
+        expected = H.toarray()
+
+        H_scaled = (qml.SparseHamiltonian(H, wires=0) * 2).sparse_matrix()
+        H_scaled.sort_indices()
+
+        assert np.allclose(H_scaled.toarray(), 2 * expected)
+        assert np.allclose(H.toarray(), expected)
+
     @pytest.mark.parametrize("sparse_hamiltonian", SPARSEHAMILTONIAN_TEST_MATRIX)
     def test_scalar_multipication_typeerror(self, sparse_hamiltonian):
         """Tests if the __mul__ method of SparseHamiltonian throws the correct error."""
@@ -25,10 +25,12 @@ from pennylane import numpy as pnp
 from pennylane.pauli import are_identical_pauli_words, are_pauli_words_qwc
 from pennylane.pauli.grouping.group_observables import (
     PauliGroupingStrategy,
+    _compute_partition_indices_from_binary,
     compute_partition_indices,
     group_observables,
     items_partitions_from_idx_partitions,
 )
+from pennylane.pauli.utils import _binary_matrix_from_pws
 
 
 class TestOldRX:
@@ -587,6 +589,22 @@ class TestComputePartitionIndices:
         )
         assert set(partition_indices) == set(((0,), (1, 2)))
 
+    @pytest.mark.parametrize("grouping_type", ("qwc", "commuting", "anticommuting"))
+    def test_partition_indices_from_binary(self, grouping_type):
+        """Test that partitioning from a precomputed binary matrix, with a different wire order,
+        gives the same result as ``compute_partition_indices``."""
+        observables = [qml.X(0) @ qml.Z(1), qml.Z(0), qml.X(1), qml.Y("a") @ qml.Z(0), qml.I()]
+        pauli_words = [next(iter(obs.pauli_rep)) for obs in observables]
+        wire_map = {"a": 0, 1: 1, 0: 2}
+        binary_matrix = _binary_matrix_from_pws(pauli_words, 3, wire_map=wire_map)
+
+        partition_indices = _compute_partition_indices_from_binary(
+            observables, binary_matrix, grouping_type=grouping_type
+        )
+        assert partition_indices == compute_partition_indices(
+            observables, grouping_type=grouping_type
+        )
+
 
 class TestDifferentiable:
     """Tests that grouping observables is differentiable with respect to the coefficients."""
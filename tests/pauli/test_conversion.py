@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for utility functions of Pauli arithmetic."""
+
 import warnings
 
 import numpy as np
@@ -367,6 +368,39 @@ class TestPhasedDecomposition:
             assert set(ps.wires) == set(wire_order)
             assert h.wires.toset() == set(wire_order)
 
+    @pytest.mark.parametrize("num_qubits", [1, 2, 3, 4])
+    @pytest.mark.parametrize("hide_identity", [True, False])
+    def test_tensorized_matches_walsh_hadamard(self, num_qubits, hide_identity, seed):
+        """Test that the tensorized decomposition used for NumPy matrices agrees with the
+        Walsh-Hadamard decomposition used for other interfaces."""
+        rng = np.random.default_rng(seed)
+        dim = 2**num_qubits
+        matrix = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+        # make some coefficients vanish
+        matrix[0] = 0
+
+        coeffs, obs = _generalized_pauli_decompose(matrix, hide_identity=hide_identity, pauli=True)
+        expected_coeffs, expected_obs = _generalized_pauli_decompose(
+            qml.numpy.array(matrix), hide_identity=hide_identity, pauli=True
+        )
+
+        assert obs == expected_obs
+        assert np.allclose(coeffs, expected_coeffs)
+
+    @pytest.mark.parametrize("num_qubits", [1, 2, 3])
+    def test_pauli_words_are_flat_products(self, num_qubits, seed):
+        """Test that the Pauli word operators are flat products of single-qubit Paulis."""
+        rng = np.random.default_rng(seed)
+        dim = 2**num_qubits
+        matrix = rng.normal(size=(dim, dim))
+
+        _, obs = _generalized_pauli_decompose(matrix)
+
+        for op in obs:
+            factors = op.operands if isinstance(op, qml.ops.Prod) else (op,)
+            assert len(factors) == num_qubits
+            assert all(isinstance(f, (Identity, PauliX, PauliY, PauliZ)) for f in factors)
+
     def test_wire_error(self):
         """Test incorrect wire order throws error"""
 
@@ -71,6 +71,17 @@ class TestWires:
         wires = Wires(Wires([0, 1, 2]))
         assert wires.labels == (0, 1, 2)
 
+    def test_creation_from_wires_object_reuses_labels(self, monkeypatch):
+        """Tests that creating a Wires object from another Wires object reuses its labels
+        instead of validating them again."""
+        original = Wires(["a", 0])
+        monkeypatch.setattr(qml.wires, "_process", lambda _: pytest.fail("wires reprocessed"))
+
+        wires = Wires(original)
+        assert type(wires) is Wires
+        assert wires.labels is original.labels
+        assert wires == original
+
     def test_creation_from_wires_lists(self):
         """Tests that a Wires object can be created from a list of Wires."""
 